@@ -1,62 +1,122 @@
 """Jarvis AI Agent -- entry point."""
-import argparse
+import itertools
+import operator
 import os
 import sys
 import time
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import argparse
+
+try:
+    import orjson as _json
+except ImportError:  # orjson is optional; both expose loads() and JSONDecodeError
+    import json as _json
 
 _start_time = time.perf_counter()
 
+_PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
+_LEARNINGS_PATH = os.path.join(_PROJECT_ROOT, "memory", "learnings.json")
+_PLUGINS_DIR = os.path.join(_PROJECT_ROOT, "plugins")
+
 # Ensure project root is on the path so the jarvis package is importable
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, _PROJECT_ROOT)
 
-from jarvis.config import Config
-from jarvis.conversation import Conversation
 from jarvis.logger import log
-from jarvis.tool_registry import ToolRegistry
-from jarvis.backends import create_backend
-from jarvis.core import build_system_prompt
-from jarvis.memory import Memory
 
+# Heavy jarvis modules are imported on demand so subcommands like
+# ``check-config`` and ``new-plugin`` don't pay for backends/tools at startup.
+_LAZY_IMPORTS = {
+    "Config": "jarvis.config",
+    "Conversation": "jarvis.conversation",
+    "ToolRegistry": "jarvis.tool_registry",
+    "create_backend": "jarvis.backends",
+    "build_system_prompt": "jarvis.core",
+    "Memory": "jarvis.memory",
+}
+
+
+def __getattr__(name: str):
+    """Resolve lazily-imported names on first attribute access (PEP 562)."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def _build_registry(config, plugin_cache: bool = False, memory=None):
+    """Build and return a fully-loaded tool registry.
+
+    Pass ``memory`` to reuse an already-loaded Memory for the memory tools.
+    ``plugin_cache`` registers unchanged plugins from their cached schemas
+    instead of executing them; meant for metadata-only commands.
+    """
+    from jarvis.memory import Memory
+    from jarvis.tool_registry import ToolRegistry
 
-def _build_registry(config: Config) -> ToolRegistry:
-    """Build and return a fully-loaded tool registry."""
-    project_root = os.path.dirname(os.path.abspath(__file__))
     registry = ToolRegistry()
+    # Tool modules, memory and plugins are only loaded once a command asks for them
     from jarvis.tools import register_all
-    register_all(registry, config)
-    from jarvis.tools.memory_tools import register as register_memory_tools
-    memory = Memory(path=os.path.join(project_root, "memory", "learnings.json"))
-    register_memory_tools(registry, memory)
+    register_all(registry, config, lazy=True)
+
+    def load_memory_tools(reg):
+        from jarvis.tools.memory_tools import register as register_memory_tools
+        register_memory_tools(reg, memory if memory is not None else Memory(path=_LEARNINGS_PATH))
+
+    registry.register_lazy(("general",), load_memory_tools)
     # Skip plugins for local models -- too many tool schemas confuses small models
     if config.backend != "ollama":
-        registry.load_plugins(os.path.join(project_root, "plugins"))
+        registry.register_lazy((), lambda reg: reg.load_plugins(_PLUGINS_DIR, use_cache=plugin_cache))
     return registry
 
 
+def _write_stdout(text: str) -> None:
+    """Write text to stdout as a single encoded block on the binary buffer."""
+    out = sys.stdout
+    buffer = getattr(out, "buffer", None)
+    if buffer is None:  # e.g. stdout replaced by a StringIO
+        out.write(text)
+        return
+    out.flush()
+    buffer.write(text.encode(out.encoding or "utf-8", out.errors or "strict"))
+    buffer.flush()
+
+
+_MD_HEADER = "# Jarvis Tool Reference\n\n"
+_MD_TABLE_HEADER = ("| Parameter | Type | Required | Description |\n"
+                    "|-----------|------|----------|-------------|\n")
+
+
 def cmd_tools(args) -> None:
     """List all available tools."""
-    config = Config.load()
-    registry = _build_registry(config)
-    tools = registry.all_tools()
+    from jarvis.config import Config
 
+    config = Config.load()
+    registry = _build_registry(config, plugin_cache=True)
     if args.category:
-        tools = [t for t in tools if t.category == args.category]
-
-    # Group by category
-    by_category: dict[str, list] = {}
-    for t in tools:
-        by_category.setdefault(t.category, []).append(t)
-
-    for cat in sorted(by_category):
-        print(f"\n[{cat}]")
-        for t in sorted(by_category[cat], key=lambda x: x.name):
-            print(f"  {t.name:25s} {t.description[:60]}")
+        tools = registry.tools_by_category(args.category)
+    else:
+        tools = registry.sorted_tools()
 
-    print(f"\nTotal: {len(tools)} tools in {len(by_category)} categories")
+    # tools is already ordered by (category, name), so one groupby pass suffices
+    parts: list[str] = []
+    n_categories = 0
+    for cat, group in itertools.groupby(tools, key=operator.attrgetter("category")):
+        n_categories += 1
+        parts.append(f"\n[{cat}]\n")
+        parts.extend(f"  {t.name:25s} {t.description[:60]}\n" for t in group)
+    parts.append(f"\nTotal: {len(tools)} tools in {n_categories} categories\n")
+    _write_stdout("".join(parts))
 
 
 def cmd_check_config(args) -> None:
     """Validate configuration."""
+    from jarvis.config import Config
+
     try:
         config = Config.load()
         print(f"Backend:    {config.backend}")
@@ -71,9 +131,35 @@ def cmd_check_config(args) -> None:
         sys.exit(1)
 
 
+_EXIT_COMMANDS = frozenset({"quit", "exit"})
+
+
+def _iter_user_input():
+    """Yield stripped user lines until EOF.
+
+    Piped input is consumed straight from stdin with no prompt; interactive
+    sessions use input() with readline imported once for editing/history.
+    """
+    if not sys.stdin.isatty():
+        for raw in sys.stdin:
+            yield raw.strip()
+        return
+    try:
+        import readline  # noqa: F401 -- enables line editing for input()
+    except ImportError:
+        pass  # Not available on Windows
+    while True:
+        yield input("\nYou: ").strip()
+
+
 def cmd_chat(args) -> None:
     """Run the interactive chat (default command)."""
-    project_root = os.path.dirname(os.path.abspath(__file__))
+    from jarvis.backends import create_backend
+    from jarvis.config import Config
+    from jarvis.conversation import Conversation
+    from jarvis.core import build_system_prompt
+    from jarvis.memory import Memory
+
     try:
         config = Config.load()
     except ValueError as e:
@@ -88,15 +174,15 @@ def cmd_chat(args) -> None:
         log.error("Failed to initialize %s backend: %s", config.backend, e)
         sys.exit(1)
 
-    memory = Memory(path=os.path.join(project_root, "memory", "learnings.json"))
+    memory = Memory(path=_LEARNINGS_PATH)
     compact = config.backend == "ollama"
     system_prompt = build_system_prompt(config.system_prompt, memory.get_summary(), compact=compact)
 
-    registry = _build_registry(config)
+    registry = _build_registry(config, memory=memory)
 
     startup_ms = (time.perf_counter() - _start_time) * 1000
     log.info("Jarvis AI Agent (%s/%s) — started in %.0fms", config.backend, config.model, startup_ms)
-    log.info("Tools loaded: %d", len(registry.all_tools()))
+    log.info("Tools loaded: %d", registry.tool_count)
     if memory.count:
         log.info("Learnings loaded: %d", memory.count)
     print("Commands: 'quit' to exit, '/clear' to reset conversation")
@@ -104,46 +190,62 @@ def cmd_chat(args) -> None:
 
     convo = Conversation(backend, registry, system_prompt, config.max_tokens,
                          use_tool_router=(config.backend == "ollama"))
+    inputs = _iter_user_input()
     while True:
         try:
-            user_input = input("\nYou: ").strip()
-        except (EOFError, KeyboardInterrupt):
+            user_input = next(inputs)
+        except (StopIteration, EOFError, KeyboardInterrupt):
             print("\nGoodbye!")
             break
-        if user_input.lower() in ("quit", "exit"):
+        # Length check first so ordinary prompts skip the .lower() copy
+        n = len(user_input)
+        if n == 4 and user_input.lower() in _EXIT_COMMANDS:
             print("Goodbye!")
             break
-        if user_input.lower() == "/clear":
+        if n == 6 and user_input.lower() == "/clear":
             convo.clear()
             print("(conversation cleared)")
             continue
         if not user_input:
             continue
-        response = convo.send(user_input)
-        print(f"\nJarvis: {response}")
+        streamed = []
+
+        def on_text(chunk: str) -> None:
+            if not streamed:
+                sys.stdout.write("\nJarvis: ")
+            streamed.append(chunk)
+            sys.stdout.write(chunk)
+            sys.stdout.flush()
+
+        response = convo.send(user_input, on_text=on_text)
+        if streamed:
+            print()
+        else:
+            print(f"\nJarvis: {response}")
 
 
 def cmd_docs(args) -> None:
     """Generate tool documentation from ToolDef schemas."""
+    from jarvis.config import Config
+
     config = Config.load()
-    registry = _build_registry(config)
-    tools = sorted(registry.all_tools(), key=lambda t: (t.category, t.name))
+    registry = _build_registry(config, plugin_cache=True)
+    tools = registry.sorted_tools()
 
+    parts: list[str] = []
     fmt = args.format
     if fmt == "markdown":
-        print("# Jarvis Tool Reference\n")
+        parts.append(_MD_HEADER)
         current_cat = None
         for t in tools:
             if t.category != current_cat:
                 current_cat = t.category
-                print(f"\n## {current_cat.title()}\n")
-            print(f"### `{t.name}`\n")
-            print(f"{t.description}\n")
-            props = t.parameters.get("properties", {})
-            required = set(t.parameters.get("required", []))
+                parts.append(f"\n## {current_cat.title()}\n\n")
+            parts.append(f"### `{t.name}`\n\n{t.description}\n\n")
+            props = t.props
+            required = t.required
             if props:
-                print("| Parameter | Type | Required | Description |")
-                print("|-----------|------|----------|-------------|")
+                parts.append(_MD_TABLE_HEADER)
                 for pname, pinfo in props.items():
                     req = "Yes" if pname in required else "No"
                     ptype = pinfo.get("type", "any")
@@ -151,33 +253,34 @@ def cmd_docs(args) -> None:
                     default = pinfo.get("default")
                     if default is not None:
                         desc += f" (default: `{default}`)"
-                    print(f"| `{pname}` | {ptype} | {req} | {desc} |")
-                print()
+                    parts.append(f"| `{pname}` | {ptype} | {req} | {desc} |\n")
+                parts.append("\n")
     else:
         for t in tools:
-            print(f"[{t.category}] {t.name}")
-            print(f"  {t.description}")
-            props = t.parameters.get("properties", {})
-            required = set(t.parameters.get("required", []))
-            for pname, pinfo in props.items():
-                req = "*" if pname in required else " "
-                ptype = pinfo.get("type", "any")
-                desc = pinfo.get("description", "")
-                print(f"  {req} {pname} ({ptype}): {desc}")
-            print()
+            parts.append(f"[{t.category}] {t.name}\n  {t.description}\n")
+            props = t.props
+            required = t.required
+            parts.extend(
+                f"  {'*' if pname in required else ' '} {pname} "
+                f"({pinfo.get('type', 'any')}): {pinfo.get('description', '')}\n"
+                for pname, pinfo in props.items()
+            )
+            parts.append("\n")
 
-    print(f"\n---\nGenerated from {len(tools)} tools")
+    parts.append(f"\n---\nGenerated from {len(tools)} tools\n")
+    _write_stdout("".join(parts))
 
 
 def cmd_benchmark(args) -> None:
     """Run performance benchmarks on tools."""
+    from jarvis.config import Config
+
     config = Config.load()
     registry = _build_registry(config)
 
     from jarvis.benchmark import benchmark_tool, run_tool_suite, generate_report
 
     if args.tool:
-        import json as _json
         tool_args = _json.loads(args.tool_args) if args.tool_args else {}
         result = benchmark_tool(registry, args.tool, tool_args, iterations=args.iterations)
         print(result)
@@ -186,17 +289,9 @@ def cmd_benchmark(args) -> None:
         print(generate_report(results))
 
 
-def cmd_new_plugin(args) -> None:
-    """Scaffold a new plugin from a template."""
-    name = args.name.lower().replace("-", "_")
-    project_root = os.path.dirname(os.path.abspath(__file__))
-    plugin_path = os.path.join(project_root, "plugins", f"{name}.py")
-
-    if os.path.exists(plugin_path):
-        print(f"Error: Plugin '{name}' already exists at {plugin_path}", file=sys.stderr)
-        sys.exit(1)
-
-    template = f'''"""Plugin: {name}
+# Scaffold written by ``new-plugin``; every ``__NAME__`` is replaced with the plugin name.
+# Stored pre-encoded so rendering and writing never go through a text codec.
+_PLUGIN_TEMPLATE = b'''"""Plugin: __NAME__
 
 Description: TODO - describe what this plugin does.
 Author: Jarvis Team
@@ -206,7 +301,7 @@ Version: 1.0.0
 from jarvis.tool_registry import ToolDef
 
 
-def {name}_action(input_text: str) -> str:
+def __NAME___action(input_text: str) -> str:
     """TODO: Implement the main action for this tool.
 
     Args:
@@ -216,30 +311,50 @@ def {name}_action(input_text: str) -> str:
         Result string.
     """
     # TODO: implement
-    return f"Processed: {{input_text}}"
+    return f"Processed: {input_text}"
 
 
 def register(registry) -> None:
     """Register tools with the Jarvis tool registry."""
     registry.register(ToolDef(
-        name="{name}",
+        name="__NAME__",
         description="TODO: describe what this tool does.",
-        parameters={{
-            "properties": {{
-                "input_text": {{
+        parameters={
+            "properties": {
+                "input_text": {
                     "type": "string",
                     "description": "The input to process.",
-                }},
-            }},
+                },
+            },
             "required": ["input_text"],
-        }},
-        func={name}_action,
+        },
+        func=__NAME___action,
         category="custom",
     ))
 '''
-    os.makedirs(os.path.dirname(plugin_path), exist_ok=True)
-    with open(plugin_path, "w", encoding="utf-8") as f:
-        f.write(template)
+
+
+def cmd_new_plugin(args) -> None:
+    """Scaffold a new plugin from a template."""
+    name = args.name.lower().replace("-", "_")
+    plugin_path = os.path.join(_PLUGINS_DIR, f"{name}.py")
+
+    rendered = _PLUGIN_TEMPLATE.replace(b"__NAME__", name.encode("utf-8"))
+    # O_EXCL makes the existence check and the create a single atomic open
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+    try:
+        try:
+            fd = os.open(plugin_path, flags, 0o644)
+        except FileNotFoundError:
+            os.makedirs(_PLUGINS_DIR, exist_ok=True)
+            fd = os.open(plugin_path, flags, 0o644)
+    except FileExistsError:
+        print(f"Error: Plugin '{name}' already exists at {plugin_path}", file=sys.stderr)
+        sys.exit(1)
+    try:
+        os.write(fd, rendered)
+    finally:
+        os.close(fd)
     print(f"Created plugin scaffold: {plugin_path}")
     print(f"Next steps:")
     print(f"  1. Edit {plugin_path} to implement your tool logic")
@@ -249,7 +364,8 @@ def register(registry) -> None:
 
 def cmd_test_tool(args) -> None:
     """Test a specific tool interactively."""
-    import json as _json
+    from jarvis.config import Config
+
     config = Config.load()
     registry = _build_registry(config)
     tool = registry.get(args.name)
@@ -262,8 +378,8 @@ def cmd_test_tool(args) -> None:
     print(f"Description: {tool.description}")
     print(f"Category: {tool.category}")
 
-    props = tool.parameters.get("properties", {})
-    required = set(tool.parameters.get("required", []))
+    props = tool.props
+    required = tool.required
 
     if args.args_json:
         try:
@@ -313,47 +429,57 @@ def cmd_test_tool(args) -> None:
     print(f"Result length: {len(result)} chars")
 
 
+# Subcommand specs: (name, help, handler name, ((flags, kwargs), ...)).
+# Kept as static data so the parser is built from a table, once per process.
+_COMMAND_SPECS: tuple = (
+    ("chat", "Start interactive chat (default)", "cmd_chat", ()),
+    ("tools", "List all available tools", "cmd_tools", (
+        (("--category", "-c"), {"help": "Filter by category"}),
+    )),
+    ("check-config", "Validate configuration", "cmd_check_config", ()),
+    ("benchmark", "Run performance benchmarks", "cmd_benchmark", (
+        (("--tool", "-t"), {"help": "Benchmark a specific tool"}),
+        (("--args",), {"dest": "tool_args", "help": "JSON args for the tool"}),
+        (("--iterations", "-n"), {"type": int, "default": 5, "help": "Number of iterations"}),
+    )),
+    ("new-plugin", "Scaffold a new plugin", "cmd_new_plugin", (
+        (("name",), {"help": "Plugin name (e.g., my_tool)"}),
+    )),
+    ("test-tool", "Test a specific tool interactively", "cmd_test_tool", (
+        (("name",), {"help": "Tool name to test"}),
+        (("--args", "-a"), {"dest": "args_json", "help": "JSON object of arguments"}),
+    )),
+    ("docs", "Generate tool documentation", "cmd_docs", (
+        (("--format", "-f"), {"choices": ["text", "markdown"], "default": "markdown"}),
+    )),
+)
+
+_PARSER: "argparse.ArgumentParser | None" = None
+
+
+def _get_parser() -> "argparse.ArgumentParser":
+    """Return the CLI parser, building it from _COMMAND_SPECS on first use."""
+    global _PARSER
+    if _PARSER is None:
+        import argparse  # deferred: the bare `python agent.py` path never needs it
+        parser = argparse.ArgumentParser(description="Jarvis AI Agent")
+        subparsers = parser.add_subparsers(dest="command")
+        handlers = globals()
+        for name, help_text, handler, arguments in _COMMAND_SPECS:
+            sub = subparsers.add_parser(name, help=help_text)
+            for flags, kwargs in arguments:
+                sub.add_argument(*flags, **kwargs)
+            sub.set_defaults(func=handlers[handler])
+        _PARSER = parser
+    return _PARSER
+
+
 def main() -> None:
-    parser = argparse.ArgumentParser(description="Jarvis AI Agent")
-    subparsers = parser.add_subparsers(dest="command")
-
-    # Default: chat
-    chat_parser = subparsers.add_parser("chat", help="Start interactive chat (default)")
-    chat_parser.set_defaults(func=cmd_chat)
-
-    # tools
-    tools_parser = subparsers.add_parser("tools", help="List all available tools")
-    tools_parser.add_argument("--category", "-c", help="Filter by category")
-    tools_parser.set_defaults(func=cmd_tools)
-
-    # check-config
-    config_parser = subparsers.add_parser("check-config", help="Validate configuration")
-    config_parser.set_defaults(func=cmd_check_config)
-
-    # benchmark
-    bench_parser = subparsers.add_parser("benchmark", help="Run performance benchmarks")
-    bench_parser.add_argument("--tool", "-t", help="Benchmark a specific tool")
-    bench_parser.add_argument("--args", dest="tool_args", help="JSON args for the tool")
-    bench_parser.add_argument("--iterations", "-n", type=int, default=5, help="Number of iterations")
-    bench_parser.set_defaults(func=cmd_benchmark)
-
-    # new-plugin
-    plugin_parser = subparsers.add_parser("new-plugin", help="Scaffold a new plugin")
-    plugin_parser.add_argument("name", help="Plugin name (e.g., my_tool)")
-    plugin_parser.set_defaults(func=cmd_new_plugin)
-
-    # test-tool
-    test_parser = subparsers.add_parser("test-tool", help="Test a specific tool interactively")
-    test_parser.add_argument("name", help="Tool name to test")
-    test_parser.add_argument("--args", "-a", dest="args_json", help="JSON object of arguments")
-    test_parser.set_defaults(func=cmd_test_tool)
-
-    # docs
-    docs_parser = subparsers.add_parser("docs", help="Generate tool documentation")
-    docs_parser.add_argument("--format", "-f", choices=["text", "markdown"], default="markdown")
-    docs_parser.set_defaults(func=cmd_docs)
-
-    args = parser.parse_args()
+    # Fast path for the default UX: plain `python agent.py` goes straight to chat
+    if len(sys.argv) == 1:
+        cmd_chat(None)
+        return
+    args = _get_parser().parse_args()
 
     if args.command is None:
         cmd_chat(args)
@@ -1,16 +1,63 @@
 """Audit logging: track who did what, when."""
 
+import atexit
 import json
 import logging
 import os
+import queue
+import re
 import threading
+import time
+from contextlib import contextmanager
 from datetime import datetime, timezone
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
+try:
+    import fcntl
+except ImportError:  # Windows: no advisory locks, rely on O_APPEND alone
+    fcntl = None
+
 log = logging.getLogger("jarvis.audit")
 
 _AUDIT_DIR = os.path.join(os.path.dirname(__file__), "data")
 _AUDIT_FILE = os.path.join(_AUDIT_DIR, "audit.log")
-_lock = threading.Lock()
+_AUDIT_MAX_BYTES = 5 * 1024 * 1024  # Rotate to audit.log.1 past this size
+_BATCH_MAX = 256  # Max entries coalesced into a single write
+# Once an entry arrives the flusher keeps collecting for up to this long
+# (or until _BATCH_MAX / a flush() request) so bursts share one write.
+_FLUSH_INTERVAL = 1.0
+# Writes up to this size are a single O_APPEND write(2), which the kernel
+# appends atomically; larger batches take an flock so workers sharing the
+# file can't interleave.
+_ATOMIC_WRITE_MAX = 4096
+_lock = threading.Lock()  # In-process only: guards _fd between flusher and flush()
+
+# audit_log() only enqueues; a daemon thread drains the queue and appends
+# whole batches through one long-lived O_APPEND descriptor.
+_queue: queue.SimpleQueue = queue.SimpleQueue()  # bytes lines, or Events from flush()
+_fd: int | None = None
+_writer: threading.Thread | None = None
+
+# Secret-looking "key=value" / "key: value" pairs are masked before an entry
+# is logged or persisted. The plain substring pre-filter lets the common case
+# (no secret keyword at all) skip the regex entirely.
+_SECRET_TOKENS = ("password", "passwd", "secret", "token", "api_key", "apikey", "authorization")
+_REDACT_RE = re.compile(
+    r"(password|passwd|secret|token|api_key|apikey|authorization)(\s*[:=]\s*(?:bearer\s+|basic\s+)?)(\S+)",
+    re.IGNORECASE,
+)
+
+
+def _sanitize_detail(detail: str) -> str:
+    """Mask secret values in an audit detail string."""
+    lowered = detail.lower()
+    if not any(tok in lowered for tok in _SECRET_TOKENS):
+        return detail
+    return _REDACT_RE.sub(r"\1\2[REDACTED]", detail)
 
 
 def audit_log(
@@ -29,6 +76,7 @@ def audit_log(
         detail: Additional context.
         ip: Client IP address.
     """
+    detail = _sanitize_detail(detail)
     entry = {
         "timestamp": datetime.now(timezone.utc).isoformat(),
         "user_id": user_id,
@@ -37,29 +85,182 @@ def audit_log(
         "detail": detail,
         "ip": ip,
     }
-    log.info("AUDIT: user=%s action=%s detail=%s", username, action, detail[:200])
-    try:
+    if log.isEnabledFor(logging.INFO):  # Skip the detail slice when INFO is filtered out
+        log.info("AUDIT: user=%s action=%s detail=%s", username, action, detail[:200])
+    _queue.put(_dumps(entry) + b"\n")
+    _ensure_writer()
+
+
+def _dumps(entry: dict) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(entry)
+    return json.dumps(entry, ensure_ascii=False).encode("utf-8")
+
+
+def _loads(line: bytes):
+    return orjson.loads(line) if orjson is not None else json.loads(line)
+
+
+def _ensure_writer() -> None:
+    global _writer
+    if _writer is not None:
+        return
+    with _lock:
+        if _writer is None:
+            _writer = threading.Thread(target=_flusher, name="audit-flusher", daemon=True)
+            _writer.start()
+
+
+def _flusher() -> None:
+    """Background loop: block for one entry, then gather a batch and write it."""
+    while True:
+        batch = [_queue.get()]
+        _collect_into(batch)
         with _lock:
-            os.makedirs(_AUDIT_DIR, exist_ok=True)
-            with open(_AUDIT_FILE, "a", encoding="utf-8") as f:
-                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            _write_batch([item for item in batch if isinstance(item, bytes)])
+        # flush() waiters are released only after everything queued before them is on disk
+        for item in batch:
+            if isinstance(item, threading.Event):
+                item.set()
+
+
+def _collect_into(batch: list) -> None:
+    """Add queued items to batch for up to _FLUSH_INTERVAL.
+
+    Stops early once the batch is full or a flush() request arrives.
+    """
+    deadline = time.monotonic() + _FLUSH_INTERVAL
+    while len(batch) < _BATCH_MAX and not isinstance(batch[-1], threading.Event):
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return
+        try:
+            batch.append(_queue.get(timeout=remaining))
+        except queue.Empty:
+            return
+
+
+def _drain_into(batch: list) -> None:
+    try:
+        while len(batch) < _BATCH_MAX:
+            batch.append(_queue.get_nowait())
+    except queue.Empty:
+        pass
+
+
+def _open_fd() -> int:
+    os.makedirs(_AUDIT_DIR, exist_ok=True)
+    flags = os.O_WRONLY | os.O_CREAT | os.O_APPEND | getattr(os, "O_BINARY", 0)
+    return os.open(_AUDIT_FILE, flags, 0o644)
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
+
+@contextmanager
+def _flocked(fd: int):
+    """Hold an exclusive advisory lock on fd (no-op where fcntl is unavailable)."""
+    if fcntl is None:
+        yield
+        return
+    fcntl.flock(fd, fcntl.LOCK_EX)
+    try:
+        yield
+    finally:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+
+
+def _write_batch(batch: list[bytes]) -> None:
+    """Append a batch to the audit file, rotating by size. Caller holds _lock."""
+    global _fd
+    if not batch:
+        return
+    data = b"".join(batch)
+    try:
+        if _fd is None:
+            _fd = _open_fd()
+        if len(data) <= _ATOMIC_WRITE_MAX:
+            _write_all(_fd, data)
+        else:
+            with _flocked(_fd):
+                _write_all(_fd, data)
+        if os.fstat(_fd).st_size >= _AUDIT_MAX_BYTES:
+            _rotate()
     except Exception as e:
         log.error("Failed to write audit log: %s", e)
 
 
+def _rotate() -> None:
+    """Move the full log to audit.log.1 and reopen. Caller holds _lock."""
+    global _fd
+    with _flocked(_fd):
+        # Another worker may already have rotated; only rename our own file
+        try:
+            ours = os.stat(_AUDIT_FILE).st_ino == os.fstat(_fd).st_ino
+        except FileNotFoundError:
+            ours = False
+        if ours:
+            os.replace(_AUDIT_FILE, _AUDIT_FILE + ".1")
+    os.close(_fd)
+    _fd = _open_fd()
+
+
+def flush(timeout: float = 5.0) -> None:
+    """Block until every entry queued so far has been written to disk."""
+    if _writer is not None and _writer.is_alive():
+        done = threading.Event()
+        _queue.put(done)
+        done.wait(timeout)
+        return
+    with _lock:
+        while True:
+            batch: list = []
+            _drain_into(batch)
+            if not batch:
+                return
+            _write_batch([item for item in batch if isinstance(item, bytes)])
+
+
+atexit.register(flush)
+
+
+_TAIL_CHUNK = 8192
+
+
+def _tail_lines(f, limit: int) -> list[bytes]:
+    """Return up to the last ``limit`` non-empty lines of a binary file.
+
+    Reads fixed-size blocks backwards from EOF, so cost scales with the
+    lines returned rather than the size of the file.
+    """
+    f.seek(0, os.SEEK_END)
+    pos = f.tell()
+    buf = b""
+    while pos > 0 and buf.count(b"\n") <= limit:
+        step = min(_TAIL_CHUNK, pos)
+        pos -= step
+        f.seek(pos)
+        buf = f.read(step) + buf
+    pieces = buf.split(b"\n")
+    if pos > 0:
+        pieces = pieces[1:]  # First piece may be a partial line
+    lines = [line for line in pieces if line.strip()]
+    return lines[-limit:] if limit > 0 else []
+
+
 def get_recent_entries(limit: int = 100) -> list[dict]:
     """Read the most recent audit log entries."""
+    flush()
     if not os.path.exists(_AUDIT_FILE):
         return []
     try:
         with _lock:
-            with open(_AUDIT_FILE, "r", encoding="utf-8") as f:
-                lines = f.readlines()
-        entries = []
-        for line in lines[-limit:]:
-            line = line.strip()
-            if line:
-                entries.append(json.loads(line))
+            with open(_AUDIT_FILE, "rb") as f:
+                lines = _tail_lines(f, limit)
+        entries = [_loads(line) for line in lines]
         return list(reversed(entries))  # Most recent first
     except Exception as e:
         log.error("Failed to read audit log: %s", e)
@@ -1,13 +1,36 @@
 """Simple JWT authentication with JSON file user storage."""
 
+import atexit
+import base64
+import functools
+import hashlib
+import hmac
 import json
 import os
+import secrets
+import tempfile
+import threading
+import time
 import uuid
+from collections import OrderedDict
+from concurrent.futures import Future
+from contextlib import contextmanager
 from datetime import datetime, timedelta, timezone
+from typing import NamedTuple
 
 import bcrypt
 from jose import JWTError, jwt
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
+try:
+    import fcntl
+except ImportError:  # Windows: no advisory locks, in-process lock only
+    fcntl = None
+
 _DEFAULT_SECRET = "jarvis-dev-secret-change-in-production"
 JWT_SECRET = os.getenv("JWT_SECRET", _DEFAULT_SECRET)
 if JWT_SECRET == _DEFAULT_SECRET:
@@ -18,57 +41,217 @@ if JWT_SECRET == _DEFAULT_SECRET:
     )
 JWT_ALGORITHM = "HS256"
 JWT_EXPIRY_HOURS = 24
+# bcrypt work factor for new hashes; stored hashes at another cost are
+# upgraded on the next successful login. Lower it (e.g. 4) for tests/dev.
+BCRYPT_COST = int(os.getenv("BCRYPT_COST", "12"))
 
 DATA_DIR = os.path.join(os.path.dirname(__file__), "data")
 USERS_FILE = os.path.join(DATA_DIR, "users.json")
+# Indent the JSON stores for hand inspection. Off by default: indentation
+# roughly doubles what every save writes and every load parses.
+PRETTY_JSON = bool(os.getenv("JARVIS_PRETTY_JSON"))
+
+
+def _json_bytes(obj) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if PRETTY_JSON else 0)
+    return json.dumps(obj, indent=2 if PRETTY_JSON else None, ensure_ascii=False).encode("utf-8")
+
+
+def _parse_json(data: bytes):
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def _file_stamp(path: str) -> tuple[int, int, int] | None:
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+class _UserIndex(NamedTuple):
+    users: list[dict]
+    by_id: dict[str, dict]
+    by_username: dict[str, dict]
+
+
+def _build_user_index(users: list[dict]) -> _UserIndex:
+    by_id: dict[str, dict] = {}
+    by_username: dict[str, dict] = {}
+    for u in users:  # First record wins, as the old linear scans did
+        by_id.setdefault(u["id"], u)
+        by_username.setdefault(u["username"], u)
+    return _UserIndex(users, by_id, by_username)
+
+
+# (path, file stamp) -> users parsed from that file, indexed by id and
+# username. Reads are served from memory and the file is only re-parsed when
+# it changes (e.g. another worker wrote it); _save_users refreshes the entry.
+_users_cache: tuple[tuple, _UserIndex] | None = None
+_users_lock = threading.Lock()  # Serializes read-modify-write of users.json
+
+
+def _user_index() -> _UserIndex:
+    """Return the shared, read-only user list and its lookup tables."""
+    global _users_cache
+    stamp = (USERS_FILE, _file_stamp(USERS_FILE))
+    cached = _users_cache
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    users: list[dict] = []
+    if stamp[1] is not None:
+        with open(USERS_FILE, "rb") as f:
+            users = _parse_json(f.read())
+    index = _build_user_index(users)
+    _users_cache = (stamp, index)
+    return index
 
 
 def _load_users() -> list[dict]:
-    if not os.path.exists(USERS_FILE):
-        return []
-    with open(USERS_FILE, "r", encoding="utf-8") as f:
-        return json.load(f)
+    """Return a copy of the user list for read-modify-write callers."""
+    return list(_user_index().users)
+
+
+def _atomic_write_json(path: str, obj) -> None:
+    """Durably replace path with obj serialized as JSON.
+
+    Written to a unique temp file in the same directory, fsynced, then renamed
+    over path, so readers (in any worker) see either the old or the new file,
+    never a partial one, and a crash can't leave a truncated store behind.
+    """
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    with tempfile.NamedTemporaryFile("wb", dir=directory, prefix=".tmp-", delete=False) as f:
+        try:
+            f.write(_json_bytes(obj))
+            f.flush()
+            os.fsync(f.fileno())
+        except BaseException:
+            f.close()
+            os.unlink(f.name)
+            raise
+    os.replace(f.name, path)
+    if hasattr(os, "O_DIRECTORY"):  # Persist the rename itself (POSIX only)
+        dir_fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
 
 
 def _save_users(users: list[dict]):
-    os.makedirs(DATA_DIR, exist_ok=True)
-    with open(USERS_FILE, "w", encoding="utf-8") as f:
-        json.dump(users, f, indent=2, ensure_ascii=False)
+    global _users_cache
+    _atomic_write_json(USERS_FILE, users)
+    _users_cache = ((USERS_FILE, _file_stamp(USERS_FILE)), _build_user_index(list(users)))
 
 
 def create_user(username: str, password: str, email: str = "") -> dict | None:
     """Create a new user. Returns user dict or None if username taken."""
-    users = _load_users()
-    if any(u["username"] == username for u in users):
+    if username in _user_index().by_username:
         return None
-    user = {
-        "id": str(uuid.uuid4()),
-        "username": username,
-        "email": email,
-        "password_hash": bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt()).decode("utf-8"),
-        "created_at": datetime.now(timezone.utc).isoformat(),
-    }
-    users.append(user)
-    _save_users(users)
+    # Hash outside the lock so concurrent registrations don't queue on bcrypt
+    password_hash = bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt(rounds=BCRYPT_COST)).decode("utf-8")
+    with _users_lock:
+        if username in _user_index().by_username:
+            return None
+        users = _load_users()
+        user = {
+            "id": str(uuid.uuid4()),
+            "username": username,
+            "email": email,
+            "password_hash": password_hash,
+            "created_at": datetime.now(timezone.utc).isoformat(),
+        }
+        users.append(user)
+        _save_users(users)
     return user
 
 
+# Recent successful password checks -> expiry. Keyed by an HMAC (under a
+# per-process random key) of password + stored hash, so a changed password or
+# hash never hits; failed checks are never cached.
+_PASSWORD_CACHE_TTL = 60.0
+_PASSWORD_CACHE_MAX = 1024
+_PASSWORD_CACHE_KEY = secrets.token_bytes(32)
+_verified_passwords: OrderedDict[bytes, float] = OrderedDict()
+_verified_passwords_lock = threading.Lock()
+_inflight_passwords: dict[bytes, Future] = {}
+
+
+def _bcrypt_cost(password_hash: str) -> int | None:
+    """Work factor of a ``$2b$NN$...`` hash, or None if it can't be parsed."""
+    try:
+        return int(password_hash[4:6])
+    except ValueError:
+        return None
+
+
+def _verify_password(password: str, password_hash: str) -> bool:
+    """bcrypt.checkpw with a short-lived cache of successful verifications."""
+    password_bytes = password.encode("utf-8")
+    hash_bytes = password_hash.encode("utf-8")
+    token = hmac.new(_PASSWORD_CACHE_KEY, password_bytes + b"\0" + hash_bytes, hashlib.sha256).digest()
+    now = time.monotonic()
+    with _verified_passwords_lock:
+        expiry = _verified_passwords.get(token)
+        if expiry is not None:
+            if expiry >= now:
+                _verified_passwords.move_to_end(token)
+                return True
+            del _verified_passwords[token]
+        # Identical checks already running (client retries, parallel logins)
+        # wait for that one bcrypt run instead of starting their own
+        pending = _inflight_passwords.get(token)
+        if pending is None:
+            _inflight_passwords[token] = future = Future()
+    if pending is not None:
+        return pending.result()
+    try:
+        ok = bcrypt.checkpw(password_bytes, hash_bytes)
+    except BaseException as e:
+        with _verified_passwords_lock:
+            del _inflight_passwords[token]
+        future.set_exception(e)
+        raise
+    with _verified_passwords_lock:
+        del _inflight_passwords[token]
+        if ok:
+            _verified_passwords[token] = now + _PASSWORD_CACHE_TTL
+            _verified_passwords.move_to_end(token)
+            while len(_verified_passwords) > _PASSWORD_CACHE_MAX:
+                _verified_passwords.popitem(last=False)
+    future.set_result(ok)
+    return ok
+
+
+@functools.lru_cache(maxsize=4)
+def _dummy_password_hash(cost: int) -> bytes:
+    """A hash of a random secret at the given cost, for unknown-user logins."""
+    return bcrypt.hashpw(secrets.token_bytes(16), bcrypt.gensalt(rounds=cost))
+
+
 def authenticate_user(username: str, password: str) -> dict | None:
     """Verify credentials. Returns user dict or None."""
-    users = _load_users()
-    for user in users:
-        if user["username"] == username and bcrypt.checkpw(password.encode("utf-8"), user["password_hash"].encode("utf-8")):
-            return user
-    return None
+    user = _user_index().by_username.get(username)
+    if user is None:
+        # Spend the same bcrypt time as a wrong password so response timing
+        # doesn't reveal which usernames exist
+        bcrypt.checkpw(password.encode("utf-8"), _dummy_password_hash(BCRYPT_COST))
+        return None
+    if not _verify_password(password, user["password_hash"]):
+        return None
+    if _bcrypt_cost(user["password_hash"]) != BCRYPT_COST:
+        new_hash = bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt(rounds=BCRYPT_COST)).decode("utf-8")
+        with _users_lock:
+            user["password_hash"] = new_hash
+            _save_users(_load_users())
+    return user
 
 
 def get_user_by_id(user_id: str) -> dict | None:
     """Look up user by ID."""
-    users = _load_users()
-    for user in users:
-        if user["id"] == user_id:
-            return user
-    return None
+    return _user_index().by_id.get(user_id)
 
 
 def create_token(user: dict) -> str:
@@ -82,8 +265,39 @@ def create_token(user: dict) -> str:
     return jwt.encode(payload, JWT_SECRET, algorithm=JWT_ALGORITHM)
 
 
+def _b64url_decode(segment: str) -> bytes:
+    return base64.urlsafe_b64decode(segment + "=" * (-len(segment) % 4))
+
+
 def decode_token(token: str) -> dict | None:
-    """Decode and validate a JWT token. Returns payload or None."""
+    """Decode and validate a JWT token. Returns payload or None.
+
+    Tokens we issue (HS256) are verified inline with hmac; this runs on every
+    authenticated request and skips python-jose's generic decode pipeline.
+    Anything else falls through to jose.
+    """
+    try:
+        header_b64, payload_b64, signature_b64 = token.split(".")
+        header = _parse_json(_b64url_decode(header_b64))
+        if JWT_ALGORITHM == "HS256" and isinstance(header, dict) and header.get("alg") == "HS256":
+            expected = hmac.new(
+                JWT_SECRET.encode("utf-8"), f"{header_b64}.{payload_b64}".encode("ascii"), hashlib.sha256,
+            ).digest()
+            if not hmac.compare_digest(expected, _b64url_decode(signature_b64)):
+                return None
+            payload = _parse_json(_b64url_decode(payload_b64))
+            if not isinstance(payload, dict):
+                return None
+            now = time.time()
+            exp = payload.get("exp")
+            if exp is not None and (not isinstance(exp, (int, float)) or exp < now):
+                return None
+            nbf = payload.get("nbf")
+            if nbf is not None and (not isinstance(nbf, (int, float)) or nbf > now):
+                return None
+            return payload
+    except ValueError:  # Malformed segments, base64 or JSON
+        return None
     try:
         payload = jwt.decode(token, JWT_SECRET, algorithms=[JWT_ALGORITHM])
         return payload
@@ -94,70 +308,362 @@ def decode_token(token: str) -> dict | None:
 # --- API Key authentication (alternative to JWT) ---
 
 API_KEYS_FILE = os.path.join(DATA_DIR, "api_keys.json")
+API_KEY_PREFIX = "jrv_"
+# Leading characters of each key stored in clear as key_prefix for lookup and
+# display. Keys created before this was widened stored 8.
+API_KEY_PREFIX_LEN = 12
+_API_KEY_PREFIX_LENS = (API_KEY_PREFIX_LEN, 8)
+# Append-only log of key mutations (create/touch/revoke) replayed over the
+# snapshot on load, so validating a key doesn't rewrite the whole file.
+API_KEYS_WAL_SUFFIX = ".wal"
+API_KEYS_WAL_MAX_BYTES = 1024 * 1024  # Compact into the snapshot past this size
+
+_api_keys_lock = threading.Lock()  # In-process; _api_keys_flocked() spans workers
+_api_keys_wal_fp = None  # Append handle for the current WAL file, reopened if it is replaced
+
+
+def _api_keys_wal_path() -> str:
+    return API_KEYS_FILE + API_KEYS_WAL_SUFFIX
+
+
+@contextmanager
+def _api_keys_flocked():
+    """Hold an exclusive advisory lock shared by every worker using the key store.
+
+    The lock lives on a sidecar file because compaction deletes the WAL.
+    No-op where fcntl is unavailable.
+    """
+    if fcntl is None:
+        yield
+        return
+    os.makedirs(os.path.dirname(API_KEYS_FILE), exist_ok=True)
+    fd = os.open(API_KEYS_FILE + ".lock", os.O_RDWR | os.O_CREAT, 0o600)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        yield
+    finally:
+        os.close(fd)  # Releases the lock
+
+
+def _is_current_wal(fp, wal_path: str) -> bool:
+    """True if fp still refers to the file at wal_path (not one compacted away)."""
+    if fp.name != wal_path:
+        return False
+    try:
+        st = os.stat(wal_path)
+    except FileNotFoundError:
+        return False
+    fst = os.fstat(fp.fileno())
+    return (st.st_dev, st.st_ino) == (fst.st_dev, fst.st_ino)
+
+
+# (snapshot stamp, WAL stamp) -> id-indexed key records built from them
+_api_keys_index: tuple[tuple, "_KeyIndex"] | None = None
+
+
+class _KeyIndex(NamedTuple):
+    by_id: dict[str, dict]
+    by_prefix: dict[str, list[dict]]  # stored key_prefix -> records
+    by_user: dict[str, list[dict]]  # user_id -> that user's records
+
+
+def _read_stamped(path: str) -> tuple[bytes | None, tuple[int, int, int] | None]:
+    """Read a file plus its _file_stamp, taken from the open file before reading.
+
+    Returns (None, None) if the file does not exist.
+    """
+    try:
+        f = open(path, "rb")
+    except FileNotFoundError:
+        return None, None
+    with f:
+        st = os.fstat(f.fileno())
+        return f.read(), (st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+def _api_key_index() -> _KeyIndex:
+    """Return key records indexed by id and prefix, re-reading only when a file changed.
+
+    The index is shared; callers must treat the records as read-only.
+    """
+    global _api_keys_index
+    wal_path = _api_keys_wal_path()
+    stamp = (API_KEYS_FILE, _file_stamp(API_KEYS_FILE), _file_stamp(wal_path))
+    cached = _api_keys_index
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    # Compaction (possibly in another worker) replaces the snapshot and then
+    # deletes the WAL, so open the WAL first: if it is gone, the snapshot
+    # opened after it already holds its events. Stamps come from the opened
+    # files, so the cache key always matches what was actually read.
+    wal_data, wal_stamp = _read_stamped(wal_path)
+    snapshot_data, snapshot_stamp = _read_stamped(API_KEYS_FILE)
+    stamp = (API_KEYS_FILE, snapshot_stamp, wal_stamp)
+    by_id: dict[str, dict] = {}
+    if snapshot_data is not None:
+        by_id = {k["id"]: k for k in _parse_json(snapshot_data)}
+    if wal_data is not None:
+        for line in wal_data.splitlines():
+            try:
+                event = _parse_json(line)
+            except ValueError:
+                continue  # Torn final line from an interrupted write
+            op = event.get("op")
+            if op == "create":
+                by_id[event["record"]["id"]] = event["record"]
+            elif op == "touch":
+                record = by_id.get(event["id"])
+                if record is not None:
+                    record["last_used"] = event["last_used"]
+            elif op == "revoke":
+                by_id.pop(event["id"], None)
+    by_prefix: dict[str, list[dict]] = {}
+    by_user: dict[str, list[dict]] = {}
+    for record in by_id.values():
+        by_prefix.setdefault(record["key_prefix"], []).append(record)
+        by_user.setdefault(record["user_id"], []).append(record)
+    index = _KeyIndex(by_id, by_prefix, by_user)
+    _api_keys_index = (stamp, index)
+    return index
 
 
 def _load_api_keys() -> list[dict]:
-    if not os.path.exists(API_KEYS_FILE):
-        return []
-    with open(API_KEYS_FILE, "r", encoding="utf-8") as f:
-        return json.load(f)
+    return list(_api_key_index().by_id.values())
 
 
 def _save_api_keys(keys: list[dict]):
-    os.makedirs(DATA_DIR, exist_ok=True)
-    with open(API_KEYS_FILE, "w", encoding="utf-8") as f:
-        json.dump(keys, f, indent=2, ensure_ascii=False)
+    _atomic_write_json(API_KEYS_FILE, keys)
+
+
+def _append_api_key_event(event: dict) -> None:
+    """Append one mutation to the WAL, compacting it once it grows too large."""
+    with _api_keys_lock:
+        _write_api_key_events_locked([event])
+
+
+def _write_api_key_events_locked(events: list[dict]) -> None:
+    """Append mutations to the WAL in one write. Caller holds the lock."""
+    with _api_keys_flocked():
+        _append_api_key_events_flocked(events)
+        if _api_keys_wal_fp.tell() > API_KEYS_WAL_MAX_BYTES:
+            _compact_api_keys_locked()
+
+
+def _append_api_key_events_flocked(events: list[dict]) -> None:
+    """Append to the WAL. Caller holds both the lock and _api_keys_flocked()."""
+    global _api_keys_wal_fp
+    wal_path = _api_keys_wal_path()
+    # Another worker may have compacted (deleted) the WAL since we opened
+    # it; appending to the unlinked file would silently lose the events
+    if _api_keys_wal_fp is not None and not _is_current_wal(_api_keys_wal_fp, wal_path):
+        _api_keys_wal_fp.close()
+        _api_keys_wal_fp = None
+    if _api_keys_wal_fp is None:
+        _api_keys_wal_fp = open(wal_path, "ab")
+    _api_keys_wal_fp.write(b"".join(_json_bytes(e) + b"\n" for e in events))
+    _api_keys_wal_fp.flush()
+
+
+# last_used bumps are coalesced in memory and written as one batch every
+# few seconds (or once enough keys are pending), trading a little staleness
+# for not hitting the WAL on every authenticated request.
+_TOUCH_FLUSH_INTERVAL = 5.0
+_TOUCH_FLUSH_MAX = 64
+_pending_touches: dict[str, float] = {}  # key id -> epoch seconds of last use
+_last_touch_flush = time.monotonic()
+
+
+def _touch_api_key(key_id: str) -> None:
+    with _api_keys_lock:
+        _pending_touches[key_id] = time.time()
+        if (len(_pending_touches) < _TOUCH_FLUSH_MAX
+                and time.monotonic() - _last_touch_flush < _TOUCH_FLUSH_INTERVAL):
+            return
+        _flush_touches_locked()
+
+
+def _flush_touches_locked() -> None:
+    global _last_touch_flush
+    _last_touch_flush = time.monotonic()
+    if not _pending_touches:
+        return
+    # Format timestamps once per flushed key rather than once per request
+    events = [
+        {"op": "touch", "id": kid, "last_used": datetime.fromtimestamp(ts, timezone.utc).isoformat()}
+        for kid, ts in _pending_touches.items()
+    ]
+    _pending_touches.clear()
+    _write_api_key_events_locked(events)
+
+
+def flush_api_key_touches() -> None:
+    """Write any coalesced last_used updates to the WAL now."""
+    with _api_keys_lock:
+        _flush_touches_locked()
+
+
+atexit.register(flush_api_key_touches)
+
+
+def _compact_api_keys_locked() -> None:
+    """Fold the WAL into the snapshot and truncate it.
+
+    Caller holds both the lock and _api_keys_flocked().
+    """
+    global _api_keys_wal_fp
+    _save_api_keys(_load_api_keys())
+    if _api_keys_wal_fp is not None:
+        _api_keys_wal_fp.close()
+        _api_keys_wal_fp = None
+    try:
+        os.remove(_api_keys_wal_path())
+    except FileNotFoundError:
+        pass
+
+
+def compact_api_keys() -> None:
+    """Rewrite the API key snapshot from snapshot + WAL and clear the WAL."""
+    with _api_keys_lock:
+        _flush_touches_locked()
+        with _api_keys_flocked():
+            _compact_api_keys_locked()
+
+
+# API keys carry 256 random bits, so a keyed SHA-256 fingerprint is as strong
+# as a slow KDF against guessing and costs microseconds to check. Records
+# created before this still hold bcrypt hashes and are verified as such.
+API_KEY_HMAC_SECRET = os.getenv("API_KEY_HMAC_SECRET", JWT_SECRET)
+_API_KEY_HASH_SCHEME = "hmac-sha256$"
+
+
+def _api_key_fingerprint(key_value: str) -> str:
+    return hmac.new(API_KEY_HMAC_SECRET.encode("utf-8"), key_value.encode("utf-8"), hashlib.sha256).hexdigest()
+
+
+def _verify_api_key(key_value: str, key_hash: str) -> bool:
+    if key_hash.startswith(_API_KEY_HASH_SCHEME):
+        return hmac.compare_digest(_api_key_fingerprint(key_value), key_hash[len(_API_KEY_HASH_SCHEME):])
+    return bcrypt.checkpw(key_value.encode("utf-8"), key_hash.encode("utf-8"))
 
 
 def create_api_key(user_id: str, label: str = "") -> dict:
     """Create a new API key for a user. Returns key dict with plaintext key."""
-    import secrets
-    key_value = f"jrv_{secrets.token_urlsafe(32)}"
-    key_hash = bcrypt.hashpw(key_value.encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
+    key_value = f"{API_KEY_PREFIX}{secrets.token_urlsafe(32)}"
+    key_hash = _API_KEY_HASH_SCHEME + _api_key_fingerprint(key_value)
 
-    keys = _load_api_keys()
     key_record = {
         "id": str(uuid.uuid4()),
         "user_id": user_id,
         "label": label or "default",
         "key_hash": key_hash,
-        "key_prefix": key_value[:8],
+        "key_prefix": key_value[:API_KEY_PREFIX_LEN],
         "created_at": datetime.now(timezone.utc).isoformat(),
         "last_used": None,
     }
-    keys.append(key_record)
-    _save_api_keys(keys)
+    _append_api_key_event({"op": "create", "record": key_record})
     return {"id": key_record["id"], "key": key_value, "label": key_record["label"], "prefix": key_record["key_prefix"]}
 
 
+# Recently validated keys -> (key_id, expiry). Lets a client's repeated
+# requests skip the bcrypt scan; revocation is still honoured because the
+# key_id must be present in the store on every hit. Entries are keyed by a
+# blake2s digest so raw keys never sit in memory and lookups never compare
+# secret strings directly.
+_API_KEY_CACHE_TTL = 60.0
+_API_KEY_CACHE_MAX = 4096
+_validated_keys: OrderedDict[bytes, tuple[str, float]] = OrderedDict()
+_validated_keys_lock = threading.Lock()
+
+
+def _key_digest(key_value: str) -> bytes:
+    return hashlib.blake2s(key_value.encode("utf-8"), digest_size=16).digest()
+
+
+def _cached_key_id(digest: bytes) -> str | None:
+    with _validated_keys_lock:
+        entry = _validated_keys.get(digest)
+        if entry is None:
+            return None
+        if entry[1] < time.monotonic():
+            del _validated_keys[digest]
+            return None
+        _validated_keys.move_to_end(digest)
+        return entry[0]
+
+
+def _remember_key(digest: bytes, key_id: str) -> None:
+    with _validated_keys_lock:
+        _validated_keys[digest] = (key_id, time.monotonic() + _API_KEY_CACHE_TTL)
+        _validated_keys.move_to_end(digest)
+        while len(_validated_keys) > _API_KEY_CACHE_MAX:
+            _validated_keys.popitem(last=False)
+
+
+def _forget_key_id(key_id: str) -> None:
+    with _validated_keys_lock:
+        for digest in [d for d, (kid, _) in _validated_keys.items() if kid == key_id]:
+            del _validated_keys[digest]
+
+
 def validate_api_key(key_value: str) -> dict | None:
     """Validate an API key. Returns user dict or None."""
-    keys = _load_api_keys()
-    for key_record in keys:
-        if bcrypt.checkpw(key_value.encode("utf-8"), key_record["key_hash"].encode("utf-8")):
-            # Update last_used
-            key_record["last_used"] = datetime.now(timezone.utc).isoformat()
-            _save_api_keys(keys)
+    if not key_value.startswith(API_KEY_PREFIX):
+        return None  # Not one of ours: don't load the store or run any KDF
+    index = _api_key_index()
+    digest = _key_digest(key_value)
+    cached_id = _cached_key_id(digest)
+    if cached_id is not None:
+        record = index.by_id.get(cached_id)
+        candidates = [record] if record is not None else []
+    else:
+        # Only keys whose stored prefix matches can verify; this keeps the
+        # bcrypt checks to ~1 instead of one per stored key
+        candidates = [
+            record
+            for length in _API_KEY_PREFIX_LENS
+            for record in index.by_prefix.get(key_value[:length], ())
+        ]
+    for key_record in candidates:
+        if cached_id is not None or _verify_api_key(key_value, key_record["key_hash"]):
+            if cached_id is None:
+                _remember_key(digest, key_record["id"])
+            _touch_api_key(key_record["id"])
             return get_user_by_id(key_record["user_id"])
     return None
 
 
 def list_user_api_keys(user_id: str) -> list[dict]:
     """List API keys for a user (without hashes)."""
-    keys = _load_api_keys()
     return [
         {"id": k["id"], "label": k["label"], "prefix": k["key_prefix"],
          "created_at": k["created_at"], "last_used": k.get("last_used")}
-        for k in keys if k["user_id"] == user_id
+        for k in _api_key_index().by_user.get(user_id, ())
     ]
 
 
 def revoke_api_key(user_id: str, key_id: str) -> bool:
     """Revoke an API key. Returns True if found and removed."""
-    keys = _load_api_keys()
-    original = len(keys)
-    keys = [k for k in keys if not (k["id"] == key_id and k["user_id"] == user_id)]
-    if len(keys) == original:
+    record = _api_key_index().by_id.get(key_id)
+    if record is None or record["user_id"] != user_id:
         return False
-    _save_api_keys(keys)
+    _append_api_key_event({"op": "revoke", "id": key_id})
+    _forget_key_id(key_id)
     return True
+
+
+def revoke_user_api_keys(user_id: str) -> int:
+    """Revoke every API key a user holds and erase the records. Returns the count.
+
+    The keys are revoked through the WAL and the store is then compacted, so
+    neither the snapshot nor the WAL keeps the user's key records.
+    """
+    with _api_keys_lock:
+        _flush_touches_locked()
+        with _api_keys_flocked():
+            key_ids = [k["id"] for k in _api_key_index().by_user.get(user_id, ())]
+            if key_ids:
+                _append_api_key_events_flocked([{"op": "revoke", "id": kid} for kid in key_ids])
+                _compact_api_keys_locked()
+    for key_id in key_ids:
+        _forget_key_id(key_id)
+    return len(key_ids)
@@ -1,13 +1,53 @@
 """FastAPI dependencies for authentication and session management."""
 
+import asyncio
+import hashlib
+import os
+import time
+from collections import OrderedDict
+
 from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
-from api.auth import decode_token, get_user_by_id, validate_api_key
+from api.auth import API_KEY_PREFIX, decode_token, get_user_by_id, validate_api_key
 from api.models import UserInfo
 
 security = HTTPBearer()
 
+# Resolved token -> UserInfo, so a client presenting the same bearer token
+# repeatedly skips JWT verification / API-key hashing and the user lookup.
+# Keys are blake2s digests; raw tokens are never held. AUTH_CACHE_TTL=0 disables.
+AUTH_CACHE_TTL = float(os.getenv("AUTH_CACHE_TTL", "10"))
+_AUTH_CACHE_MAX = 4096
+_user_cache: OrderedDict[str, tuple[float, UserInfo]] = OrderedDict()
+
+
+def _user_info(user: dict) -> UserInfo:
+    # Store records were validated when written; skip re-validating per request
+    return UserInfo.model_construct(id=user["id"], username=user["username"], email=user.get("email", ""))
+
+
+def _token_key(token: str) -> str:
+    return hashlib.blake2s(token.encode(), digest_size=16).hexdigest()
+
+
+def _cache_user(key: str, user: UserInfo, expires_at: float) -> None:
+    _user_cache[key] = (expires_at, user)
+    _user_cache.move_to_end(key)
+    if len(_user_cache) > _AUTH_CACHE_MAX:
+        _user_cache.popitem(last=False)
+
+
+def invalidate_cached_user(user_id: str) -> None:
+    """Drop cached token resolutions for a user (after key revocation, account deletion)."""
+    for key in [k for k, (_, u) in _user_cache.items() if u.id == user_id]:
+        del _user_cache[key]
+
+
+def _reject(key: str, detail: str) -> HTTPException:
+    _user_cache.pop(key, None)
+    return HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail=detail)
+
 
 async def get_current_user(
     request: Request,
@@ -20,28 +60,39 @@ async def get_current_user(
     - API key (prefix: jrv_) passed as bearer token
     """
     token = credentials.credentials
+    key = _token_key(token)
+    now = time.monotonic()
+    cached = _user_cache.get(key)
+    if cached is not None:
+        if now < cached[0]:
+            _user_cache.move_to_end(key)
+            return cached[1]
+        del _user_cache[key]
 
     # Check if it's an API key (starts with jrv_)
-    if token.startswith("jrv_"):
-        user = validate_api_key(token)
+    if token.startswith(API_KEY_PREFIX):
+        # Validation may verify a legacy bcrypt hash or flush last_used
+        # touches (and compact) the key store; keep that off the event loop
+        loop = asyncio.get_event_loop()
+        user = await loop.run_in_executor(None, validate_api_key, token)
         if user is None:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid API key",
-            )
-        return UserInfo(id=user["id"], username=user["username"], email=user.get("email", ""))
+            raise _reject(key, "Invalid API key")
+        info = _user_info(user)
+        if AUTH_CACHE_TTL > 0:
+            _cache_user(key, info, now + AUTH_CACHE_TTL)
+        return info
 
     # Otherwise treat as JWT
     payload = decode_token(token)
     if payload is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid or expired token",
-        )
+        raise _reject(key, "Invalid or expired token")
     user = get_user_by_id(payload["sub"])
     if user is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="User not found",
-        )
-    return UserInfo(id=user["id"], username=user["username"], email=user.get("email", ""))
+        raise _reject(key, "User not found")
+    info = _user_info(user)
+    if AUTH_CACHE_TTL > 0:
+        # Never serve a JWT from cache past its own expiry
+        ttl = min(AUTH_CACHE_TTL, payload.get("exp", 0) - time.time())
+        if ttl > 0:
+            _cache_user(key, info, now + ttl)
+    return info
@@ -1,9 +1,34 @@
 """WebConversation: captures tool calls for web display with streaming support."""
 
-import queue
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 
-from jarvis.conversation import Conversation
+from jarvis.conversation import DONE_EVENT, Conversation, StreamEvent
 from jarvis.logger import log
+from jarvis.parallel import execute_tools_parallel
+
+
+class AsyncEventQueue:
+    """Hands send_stream events from its worker thread to an async consumer.
+
+    put() is called from the conversation thread and schedules the item onto
+    the event loop; the SSE/WebSocket handler awaits get() directly instead of
+    parking an executor thread on a blocking queue.get() per event.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop | None = None):
+        self._loop = loop or asyncio.get_running_loop()
+        self._queue: asyncio.Queue = asyncio.Queue()
+
+    def put(self, item: StreamEvent) -> None:
+        try:
+            self._loop.call_soon_threadsafe(self._queue.put_nowait, item)
+        except RuntimeError:
+            pass  # Loop closed: the client is gone, nobody left to read events
+
+    async def get(self, timeout: float | None = None) -> StreamEvent:
+        """Next event; raises asyncio.TimeoutError after *timeout* seconds."""
+        return await asyncio.wait_for(self._queue.get(), timeout)
 
 
 class WebConversation(Conversation):
@@ -12,17 +37,29 @@ class WebConversation(Conversation):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._pending_tool_calls: list[dict] = []
+        # (messages list, its first message, preview) from get_first_user_message
+        self._preview: tuple[list, dict, str] | None = None
+        # (messages list, count, last converted message, entries) from get_display_messages
+        self._display: tuple[list, int, dict | None, list[dict]] | None = None
+        # Reused across turns; workers start on first use and exit once the
+        # conversation (and with it the pool) is garbage collected
+        self._tool_executor = ThreadPoolExecutor(
+            max_workers=self.TOOL_WORKERS, thread_name_prefix="jarvis-tool",
+        )
+
+    DISPLAY_RESULT_CHARS = 2000
+    TOOL_WORKERS = 8
 
     def _truncate_result(self, result: str) -> str:
-        """Truncate tool result for web display."""
-        display = result[:2000]
-        if len(result) > 2000:
-            display += f"\n... (truncated, {len(result)} chars total)"
-        return display
+        """Truncate tool result for web display (results that fit are returned as-is)."""
+        size = len(result)
+        if size <= self.DISPLAY_RESULT_CHARS:
+            return result
+        return f"{result[:self.DISPLAY_RESULT_CHARS]}\n... (truncated, {size} chars total)"
 
     def send(self, user_input: str) -> str:
         """Send a message, run the tool loop, capture tool calls, return text."""
-        self._pending_tool_calls = []
+        self._pending_tool_calls.clear()
         self.messages.append(self.backend.format_user_message(user_input))
         tools = self._resolve_tools(user_input)
         turns = 0
@@ -40,18 +77,19 @@ class WebConversation(Conversation):
                     return f"(Stopped after {self.MAX_TOOL_TURNS} tool turns to prevent runaway loop. Last response: {response.text or ''})"
 
                 self.messages.append(self.backend.format_assistant_message(response))
-                results = []
                 for tc in response.tool_calls:
                     log.info("tool call: %s", tc.name)
-                    self.total_tool_calls += 1
-                    result = self.registry.handle_call(tc.name, tc.args)
+                # Independent calls run concurrently: the turn takes as long as
+                # its slowest tool. Results come back in call order.
+                self.total_tool_calls += len(response.tool_calls)
+                results = execute_tools_parallel(self.registry, response.tool_calls, executor=self._tool_executor)
+                for tc, (_, result) in zip(response.tool_calls, results):
                     self._pending_tool_calls.append({
                         "id": tc.id,
                         "name": tc.name,
                         "args": tc.args,
                         "result": self._truncate_result(result),
                     })
-                    results.append((tc.id, result))
 
                 tool_msg = self.backend.format_tool_results(results)
                 if isinstance(tool_msg, list):
@@ -63,9 +101,13 @@ class WebConversation(Conversation):
                 self._trim_history()
                 return response.text or ""
 
-    def send_stream(self, user_input: str, event_queue: queue.Queue) -> str:
+    def send_stream(self, user_input: str, event_queue) -> str:
         """Send a message with real-time SSE events pushed to the queue.
 
+        Each event is a StreamEvent(name, data). *event_queue* is anything
+        with a thread-safe ``put(event)``: an AsyncEventQueue for the API
+        routes, or a plain queue.Queue.
+
         Events emitted:
             thinking  - Jarvis is calling the LLM
             tool_call - A tool invocation started (id, name, args)
@@ -74,12 +116,12 @@ class WebConversation(Conversation):
             done      - Stream complete
             error     - An error occurred
         """
-        self._pending_tool_calls = []
+        self._pending_tool_calls.clear()
         self.messages.append(self.backend.format_user_message(user_input))
         tools = self._resolve_tools(user_input)
         turns = 0
 
-        event_queue.put({"event": "thinking", "data": {"status": "Processing your request..."}})
+        event_queue.put(StreamEvent("thinking", {"status": "Processing your request..."}))
 
         while True:
             response = self._call_backend(tools)
@@ -92,73 +134,88 @@ class WebConversation(Conversation):
                 if turns > self.MAX_TOOL_TURNS:
                     self.messages.append(self.backend.format_assistant_message(response))
                     text = f"(Stopped after {self.MAX_TOOL_TURNS} tool turns to prevent runaway loop. Last response: {response.text or ''})"
-                    event_queue.put({"event": "text", "data": {"content": text}})
-                    event_queue.put({"event": "done", "data": {}})
+                    event_queue.put(StreamEvent("text", {"content": text}))
+                    event_queue.put(DONE_EVENT)
                     return text
 
                 self.messages.append(self.backend.format_assistant_message(response))
-                results = []
+                # Announce every call up front, run them concurrently, and emit
+                # each tool_result as soon as that tool finishes
                 for tc in response.tool_calls:
                     log.info("tool call (stream): %s", tc.name)
-                    event_queue.put({
-                        "event": "tool_call",
-                        "data": {"id": tc.id, "name": tc.name, "args": tc.args},
-                    })
+                    event_queue.put(StreamEvent("tool_call", {"id": tc.id, "name": tc.name, "args": tc.args}))
+                self.total_tool_calls += len(response.tool_calls)
 
-                    self.total_tool_calls += 1
-                    result = self.registry.handle_call(tc.name, tc.args)
-                    display_result = self._truncate_result(result)
+                displayed: dict[str, str] = {}
 
+                def on_result(tc, result: str) -> None:
+                    displayed[tc.id] = display_result = self._truncate_result(result)
+                    event_queue.put(StreamEvent("tool_result", {"id": tc.id, "name": tc.name, "result": display_result}))
+
+                results = execute_tools_parallel(
+                    self.registry, response.tool_calls, on_result=on_result, executor=self._tool_executor,
+                )
+                for tc in response.tool_calls:
                     self._pending_tool_calls.append({
                         "id": tc.id, "name": tc.name,
-                        "args": tc.args, "result": display_result,
+                        "args": tc.args, "result": displayed[tc.id],
                     })
 
-                    event_queue.put({
-                        "event": "tool_result",
-                        "data": {"id": tc.id, "name": tc.name, "result": display_result},
-                    })
-                    results.append((tc.id, result))
-
                 tool_msg = self.backend.format_tool_results(results)
                 if isinstance(tool_msg, list):
                     self.messages.extend(tool_msg)
                 else:
                     self.messages.append(tool_msg)
 
-                event_queue.put({
-                    "event": "thinking",
-                    "data": {"status": f"Processing (turn {turns + 1})..."},
-                })
+                event_queue.put(StreamEvent("thinking", {"status": f"Processing (turn {turns + 1})..."}))
             else:
                 self.messages.append(self.backend.format_assistant_message(response))
                 self._trim_history()
                 text = response.text or ""
-                event_queue.put({"event": "text", "data": {"content": text}})
-                event_queue.put({"event": "done", "data": {}})
+                event_queue.put(StreamEvent("text", {"content": text}))
+                event_queue.put(DONE_EVENT)
                 return text
 
     def get_and_clear_tool_calls(self) -> list[dict]:
-        """Return captured tool calls and reset the list."""
+        """Return captured tool calls and reset the list.
+
+        The caller takes ownership of the returned list, which is why a new
+        one is swapped in here; send()/send_stream() can then clear the
+        current list in place, since nothing outside holds it.
+        """
         calls = self._pending_tool_calls
         self._pending_tool_calls = []
         return calls
 
     def get_display_messages(self) -> list[dict]:
-        """Extract user/assistant text messages for display in the UI."""
-        result = []
-        for msg in self.messages:
+        """Extract user/assistant text messages for display in the UI.
+
+        Entries from the previous call are kept while the history has only
+        been appended to, so a refresh converts just the new messages; a
+        trimmed, summarized, restored or cleared history is converted afresh.
+        """
+        msgs = self.messages
+        count, result = 0, []
+        if self._display is not None:
+            seen, seen_count, last, shown = self._display
+            if seen is msgs and seen_count <= len(msgs) and (seen_count == 0 or msgs[seen_count - 1] is last):
+                count, result = seen_count, list(shown)
+        append = result.append
+        extract = self._extract_text
+        for msg in msgs[count:]:
             role = msg.get("role")
             content = msg.get("content")
-            if role == "user":
-                if isinstance(content, str):
-                    result.append({"role": "user", "content": content})
-                # Skip tool_result messages (content is a list)
+            # Plain-string content is the common case for both roles; tool
+            # results are user messages with list content and are skipped
+            if isinstance(content, str):
+                if role == "user" or (role == "assistant" and content):
+                    append({"role": role, "content": content})
             elif role == "assistant":
-                text = self._extract_text(content)
+                text = extract(content)
                 if text:
-                    result.append({"role": "assistant", "content": text})
-        return result
+                    append({"role": "assistant", "content": text})
+        self._display = (msgs, len(msgs), msgs[-1] if msgs else None, result)
+        return list(result)
 
     @staticmethod
     def _extract_text(content) -> str:
@@ -176,8 +233,21 @@ class WebConversation(Conversation):
         return ""
 
     def get_first_user_message(self) -> str:
-        """Get the first user message for session preview."""
-        for msg in self.messages:
+        """Get the first user message for session preview.
+
+        History only grows at the end until it is trimmed, summarized,
+        restored or cleared, and each of those replaces messages[0]; so the
+        preview is reused for as long as the list and its head are the same.
+        """
+        msgs = self.messages
+        if not msgs:
+            return ""
+        cached = self._preview
+        if cached is not None and cached[0] is msgs and cached[1] is msgs[0]:
+            return cached[2]
+        for msg in msgs:
             if msg.get("role") == "user" and isinstance(msg.get("content"), str):
-                return msg["content"][:100]
+                preview = msg["content"][:100]
+                self._preview = (msgs, msgs[0], preview)
+                return preview
         return ""
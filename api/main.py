@@ -4,8 +4,7 @@ import logging
 import platform
 import sys
 import os
-import time
-import uuid
+from time import perf_counter
 
 # Ensure project root is importable
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -22,8 +21,9 @@ from slowapi.util import get_remote_address
 
 log = logging.getLogger("jarvis.api")
 
+from api.process_stats import process_sample
 from api.session_manager import SessionManager
-from api.routers import admin, auth, chat, compliance, dashboard, tools, stats, learnings, conversation, settings, files, metrics, websocket, webhook_routes, whatsapp
+from api.webhooks import close_client as close_webhook_client
 
 limiter = Limiter(key_func=get_remote_address, default_limits=["60/minute"])
 session_manager = SessionManager()
@@ -39,7 +39,10 @@ async def lifespan(app: FastAPI):
     log.info("Jarvis API starting up...")
     session_manager.initialize()
 
+    _register_routers(app)
+
     # Inject session manager into routers that need it
+    from api.routers import admin, chat, compliance, conversation, dashboard, learnings, metrics, settings, stats, tools, websocket, whatsapp
     chat.set_session_manager(session_manager)
     tools.set_session_manager(session_manager)
     stats.set_session_manager(session_manager)
@@ -60,6 +63,7 @@ async def lifespan(app: FastAPI):
     log.info("Jarvis API shutting down...")
     _shutting_down = True
     session_manager.shutdown()
+    close_webhook_client()
     log.info("Jarvis API shutdown complete.")
 
 
@@ -124,38 +128,63 @@ async def request_logging_middleware(request: Request, call_next):
             content={"detail": "Server is shutting down"},
         )
     # Assign a correlation ID for request tracing
-    request_id = request.headers.get("X-Request-ID", str(uuid.uuid4())[:8])
-    start = time.perf_counter()
+    request_id = request.headers.get("X-Request-ID") or os.urandom(4).hex()
+    start = perf_counter()
     response = await call_next(request)
-    duration_ms = (time.perf_counter() - start) * 1000
-    response.headers["X-Request-ID"] = request_id
-    response.headers["X-API-Version"] = API_VERSION
-    if path == "/api/health" and response.status_code == 200:
-        log.debug("[%s] %s %s %d %.0fms", request_id, request.method, path, response.status_code, duration_ms)
-    else:
-        log.info("[%s] %s %s %d %.0fms", request_id, request.method, path, response.status_code, duration_ms)
+    duration_ms = (perf_counter() - start) * 1000
+    headers = response.headers
+    headers["X-Request-ID"] = request_id
+    headers["X-API-Version"] = API_VERSION
+    status_code = response.status_code
+    # Successful health probes are the bulk of traffic; log them at DEBUG
+    level = logging.DEBUG if status_code == 200 and path == "/api/health" else logging.INFO
+    if log.isEnabledFor(level):
+        log.log(level, "[%s] %s %s %d %.0fms", request_id, request.method, path, status_code, duration_ms)
     return response
 
 
-app.include_router(auth.router, prefix="/api/auth", tags=["auth"])
-app.include_router(chat.router, prefix="/api", tags=["chat"])
-app.include_router(tools.router, prefix="/api", tags=["tools"])
-app.include_router(stats.router, prefix="/api", tags=["stats"])
-app.include_router(learnings.router, prefix="/api", tags=["learnings"])
-app.include_router(conversation.router, prefix="/api/conversation", tags=["conversation"])
-app.include_router(settings.router, prefix="/api", tags=["settings"])
-app.include_router(files.router, prefix="/api/files", tags=["files"])
-app.include_router(websocket.router, prefix="/api", tags=["websocket"])
-app.include_router(webhook_routes.router, prefix="/api", tags=["webhooks"])
-app.include_router(admin.router, prefix="/api", tags=["admin"])
-app.include_router(metrics.router, prefix="/api", tags=["monitoring"])
-app.include_router(dashboard.router, prefix="/api", tags=["monitoring"])
-app.include_router(compliance.router, prefix="/api", tags=["compliance"])
-app.include_router(whatsapp.router, prefix="/api", tags=["whatsapp"])
+_routers_registered = False
+
 
-# Integration routes (voice transcription, etc.)
-from jarvis.integrations import register_integration_routes
-register_integration_routes(app)
+def _register_routers(app: FastAPI) -> None:
+    """Import the API routers and mount them on the app, once per process.
+
+    Called from the lifespan rather than at module level so that importing
+    api.main stays cheap; the routes are in place before the first request
+    is served. Later lifespans (e.g. repeated test clients) are no-ops.
+    """
+    global _routers_registered
+    if _routers_registered:
+        return
+    from api.routers import admin, auth, chat, compliance, conversation, dashboard, files, learnings, metrics, settings, stats, tools, webhook_routes, websocket, whatsapp
+
+    app.include_router(auth.router, prefix="/api/auth", tags=["auth"])
+    app.include_router(chat.router, prefix="/api", tags=["chat"])
+    app.include_router(tools.router, prefix="/api", tags=["tools"])
+    app.include_router(stats.router, prefix="/api", tags=["stats"])
+    app.include_router(learnings.router, prefix="/api", tags=["learnings"])
+    app.include_router(conversation.router, prefix="/api/conversation", tags=["conversation"])
+    app.include_router(settings.router, prefix="/api", tags=["settings"])
+    app.include_router(files.router, prefix="/api/files", tags=["files"])
+    app.include_router(websocket.router, prefix="/api", tags=["websocket"])
+    app.include_router(webhook_routes.router, prefix="/api", tags=["webhooks"])
+    app.include_router(admin.router, prefix="/api", tags=["admin"])
+    app.include_router(metrics.router, prefix="/api", tags=["monitoring"])
+    app.include_router(dashboard.router, prefix="/api", tags=["monitoring"])
+    app.include_router(compliance.router, prefix="/api", tags=["compliance"])
+    app.include_router(whatsapp.router, prefix="/api", tags=["whatsapp"])
+
+    # Integration routes (voice transcription, etc.)
+    from jarvis.integrations import register_integration_routes
+    register_integration_routes(app)
+    _routers_registered = True
+
+
+_PLATFORM_INFO = {
+    "python_version": platform.python_version(),
+    "platform": platform.system(),
+    "architecture": platform.machine(),
+}
 
 
 @app.get("/api/health")
@@ -170,11 +199,7 @@ async def health(deep: bool = False):
         "version": app.version,
         "uptime_seconds": round(session_manager.uptime_seconds, 1),
         "active_sessions": session_manager.active_session_count,
-        "system": {
-            "python_version": platform.python_version(),
-            "platform": platform.system(),
-            "architecture": platform.machine(),
-        },
+        "system": dict(_PLATFORM_INFO),
         "config": {
             "backend": session_manager.config.backend,
             "model": session_manager.config.model,
@@ -182,14 +207,10 @@ async def health(deep: bool = False):
     }
 
     # Add memory info if psutil is available
-    try:
-        import psutil
-        process = psutil.Process()
-        mem_info = process.memory_info()
-        result["system"]["memory_mb"] = round(mem_info.rss / 1024 / 1024, 1)
-        result["system"]["cpu_percent"] = process.cpu_percent(interval=None)
-    except ImportError:
-        pass
+    sample = process_sample()
+    if sample is not None:
+        result["system"]["memory_mb"] = round(sample.rss_bytes / 1024 / 1024, 1)
+        result["system"]["cpu_percent"] = sample.cpu_percent
 
     if deep:
         try:
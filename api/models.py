@@ -2,7 +2,7 @@
 
 import re
 
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, ConfigDict, field_validator
 
 MAX_MESSAGE_LENGTH = 50_000  # Characters
 
@@ -27,6 +27,9 @@ class RegisterRequest(BaseModel):
 
 
 class UserInfo(BaseModel):
+    # Frozen: get_current_user hands the same cached instance to many requests
+    model_config = ConfigDict(frozen=True)
+
     id: str
     username: str
     email: str
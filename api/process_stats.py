@@ -0,0 +1,43 @@
+"""Cached resource usage of the API process for health, metrics and dashboard."""
+
+import threading
+import time
+from typing import NamedTuple
+
+try:
+    import psutil
+except ImportError:  # pragma: no cover - psutil is optional
+    psutil = None
+
+# Probes hit /api/health far more often than memory or CPU meaningfully change
+SAMPLE_TTL = 5.0
+
+_lock = threading.Lock()
+_process = None
+_sample: "ProcessSample | None" = None
+_sampled_at = 0.0
+
+
+class ProcessSample(NamedTuple):
+    rss_bytes: int
+    cpu_percent: float
+
+
+def process_sample() -> ProcessSample | None:
+    """Return RSS and CPU usage, re-read at most every SAMPLE_TTL seconds.
+
+    One psutil.Process is kept for the life of the server, so cpu_percent
+    measures the interval since the previous sample instead of always
+    reporting 0.0 from a fresh handle. Returns None without psutil.
+    """
+    global _process, _sample, _sampled_at
+    if psutil is None:
+        return None
+    now = time.monotonic()
+    with _lock:
+        if _sample is None or now - _sampled_at >= SAMPLE_TTL:
+            if _process is None:
+                _process = psutil.Process()
+            _sample = ProcessSample(_process.memory_info().rss, _process.cpu_percent(interval=None))
+            _sampled_at = now
+        return _sample
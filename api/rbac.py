@@ -13,6 +13,7 @@ import threading
 
 from fastapi import Depends, HTTPException, status
 
+from api.deps import get_current_user
 from api.models import UserInfo
 
 log = logging.getLogger("jarvis.rbac")
@@ -96,7 +97,7 @@ def has_permission(user_id: str, permission: str) -> bool:
 
 def require_permission(permission: str):
     """FastAPI dependency that checks for a specific permission."""
-    def check(user: UserInfo = Depends()):
+    def check(user: UserInfo = Depends(get_current_user)):
         if not has_permission(user.id, permission):
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
@@ -49,18 +49,20 @@ async def system_info(user: UserInfo = Depends(get_current_user)):
 
     try:
         import psutil
+        vm = psutil.virtual_memory()
+        disk = psutil.disk_usage("/")
         info["memory"] = {
-            "total_mb": round(psutil.virtual_memory().total / 1024 / 1024, 1),
-            "available_mb": round(psutil.virtual_memory().available / 1024 / 1024, 1),
-            "percent_used": psutil.virtual_memory().percent,
+            "total_mb": round(vm.total / 1024 / 1024, 1),
+            "available_mb": round(vm.available / 1024 / 1024, 1),
+            "percent_used": vm.percent,
         }
         info["cpu"] = {
             "count": psutil.cpu_count(),
             "percent": psutil.cpu_percent(interval=None),
         }
         info["disk"] = {
-            "total_gb": round(psutil.disk_usage("/").total / 1024 / 1024 / 1024, 1),
-            "free_gb": round(psutil.disk_usage("/").free / 1024 / 1024 / 1024, 1),
+            "total_gb": round(disk.total / 1024 / 1024 / 1024, 1),
+            "free_gb": round(disk.free / 1024 / 1024 / 1024, 1),
         }
     except ImportError:
         pass
@@ -1,12 +1,14 @@
 """Auth endpoints: register, login, me."""
 
+import asyncio
+
 from fastapi import APIRouter, Depends, HTTPException, Request, status
 
 from api.audit import audit_log
 from pydantic import BaseModel
 
 from api.auth import authenticate_user, create_api_key, create_token, create_user, list_user_api_keys, revoke_api_key
-from api.deps import get_current_user
+from api.deps import get_current_user, invalidate_cached_user
 from api.models import AuthRequest, AuthResponse, RegisterRequest, UserInfo
 
 router = APIRouter()
@@ -14,7 +16,10 @@ router = APIRouter()
 
 @router.post("/register", response_model=AuthResponse)
 async def register(request: RegisterRequest, req: Request):
-    user = create_user(request.username, request.password, request.email)
+    # bcrypt releases the GIL: hash on the thread pool so concurrent
+    # registrations/logins use all cores and the event loop stays responsive
+    loop = asyncio.get_event_loop()
+    user = await loop.run_in_executor(None, create_user, request.username, request.password, request.email)
     if user is None:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
@@ -33,7 +38,8 @@ async def register(request: RegisterRequest, req: Request):
 
 @router.post("/login", response_model=AuthResponse)
 async def login(request: AuthRequest, req: Request):
-    user = authenticate_user(request.username, request.password)
+    loop = asyncio.get_event_loop()
+    user = await loop.run_in_executor(None, authenticate_user, request.username, request.password)
     if user is None:
         audit_log(
             user_id="", username=request.username, action="login_failed",
@@ -68,7 +74,9 @@ class ApiKeyCreate(BaseModel):
 @router.post("/api-keys")
 async def create_key(body: ApiKeyCreate, user: UserInfo = Depends(get_current_user)):
     """Create a new API key. The key is only shown once."""
-    key = create_api_key(user.id, body.label)
+    # Key store writes hit disk and may compact the whole store: keep them off the event loop
+    loop = asyncio.get_event_loop()
+    key = await loop.run_in_executor(None, create_api_key, user.id, body.label)
     return {"api_key": key}
 
 
@@ -81,6 +89,8 @@ async def list_keys(user: UserInfo = Depends(get_current_user)):
 @router.delete("/api-keys/{key_id}")
 async def delete_key(key_id: str, user: UserInfo = Depends(get_current_user)):
     """Revoke an API key."""
-    if not revoke_api_key(user.id, key_id):
+    loop = asyncio.get_event_loop()
+    if not await loop.run_in_executor(None, revoke_api_key, user.id, key_id):
         raise HTTPException(status_code=404, detail="API key not found")
+    invalidate_cached_user(user.id)
     return {"status": "revoked", "key_id": key_id}
@@ -2,7 +2,6 @@
 
 import asyncio
 import json
-import queue
 import threading
 from datetime import datetime, timezone
 
@@ -13,8 +12,14 @@ from slowapi import Limiter
 from slowapi.util import get_remote_address
 from starlette.responses import StreamingResponse
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
 from api.audit import audit_log
 from api.deps import get_current_user
+from api.enhanced_conversation import DONE_EVENT, AsyncEventQueue, StreamEvent
 from api.models import ChatRequest, ChatResponse, ToolCallDetail, UserInfo
 
 router = APIRouter()
@@ -32,9 +37,9 @@ def set_session_manager(sm):
 @router.post("/chat", response_model=ChatResponse)
 @limiter.limit("20/minute")
 async def chat(request: Request, body: ChatRequest, user: UserInfo = Depends(get_current_user)):
-    session = _session_manager.get_or_create(body.session_id, user.id)
-
+    # Creating a session builds a backend client and loads plugins: keep it off the event loop
     loop = asyncio.get_event_loop()
+    session = await loop.run_in_executor(None, _session_manager.get_or_create, body.session_id, user.id)
     response_text = await loop.run_in_executor(
         None, session.conversation.send, body.message
     )
@@ -82,15 +87,16 @@ async def chat_stream(
         done      - Stream complete
         error     - Error occurred
     """
-    session = _session_manager.get_or_create(body.session_id, user.id)
-    event_queue: queue.Queue = queue.Queue()
+    loop = asyncio.get_event_loop()
+    session = await loop.run_in_executor(None, _session_manager.get_or_create, body.session_id, user.id)
+    event_queue = AsyncEventQueue()
 
     def run_conversation():
         try:
             session.conversation.send_stream(body.message, event_queue)
         except Exception as e:
-            event_queue.put({"event": "error", "data": {"message": str(e)}})
-            event_queue.put({"event": "done", "data": {}})
+            event_queue.put(StreamEvent("error", {"message": str(e)}))
+            event_queue.put(DONE_EVENT)
 
     thread = threading.Thread(target=run_conversation, daemon=True)
     thread.start()
@@ -101,16 +107,14 @@ async def chat_stream(
 
         while True:
             try:
-                event = await asyncio.get_event_loop().run_in_executor(
-                    None, lambda: event_queue.get(timeout=120)
-                )
-                yield _sse(event["event"], event["data"])
+                event = await event_queue.get(timeout=120)
+                yield _sse(event.name, event.data)
 
-                if event["event"] in ("done", "error"):
+                if event.name in ("done", "error"):
                     break
-            except queue.Empty:
+            except asyncio.TimeoutError:
                 # Send keepalive to prevent connection timeout
-                yield ": keepalive\n\n"
+                yield b": keepalive\n\n"
 
     return StreamingResponse(
         event_generator(),
@@ -149,7 +153,7 @@ async def chat_batch(
     results = []
 
     for msg in body.messages:
-        session = _session_manager.get_or_create(msg.session_id, user.id)
+        session = await loop.run_in_executor(None, _session_manager.get_or_create, msg.session_id, user.id)
         try:
             response_text = await loop.run_in_executor(
                 None, session.conversation.send, msg.message
@@ -185,6 +189,7 @@ async def chat_batch(
     return {"results": results, "count": len(results)}
 
 
-def _sse(event: str, data: dict) -> str:
-    """Format a single SSE event."""
-    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+def _sse(event: str, data: dict) -> bytes:
+    """Format a single SSE event as the bytes StreamingResponse sends as-is."""
+    payload = orjson.dumps(data) if orjson is not None else json.dumps(data).encode("utf-8")
+    return b"event: %s\ndata: %s\n\n" % (event.encode("ascii"), payload)
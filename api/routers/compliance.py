@@ -12,7 +12,9 @@ from fastapi import APIRouter, Depends
 from fastapi.responses import StreamingResponse
 
 from api.audit import audit_log
-from api.deps import get_current_user
+from api.audit import flush as flush_audit_log
+from api.auth import revoke_user_api_keys
+from api.deps import get_current_user, invalidate_cached_user
 from api.models import UserInfo
 
 log = logging.getLogger("jarvis.compliance")
@@ -71,7 +73,8 @@ async def export_user_data(user: UserInfo = Depends(get_current_user)):
             if user_settings:
                 zf.writestr("settings.json", json.dumps(user_settings, indent=2))
 
-        # Audit logs (filter for this user)
+        # Audit logs (filter for this user); write out queued entries first
+        flush_audit_log()
         audit_file = os.path.join(DATA_DIR, "audit.log")
         if os.path.exists(audit_file):
             user_audits = []
@@ -127,16 +130,9 @@ async def delete_user_data(user: UserInfo = Depends(get_current_user)):
                 json.dump(all_settings, f, indent=2)
             deleted["settings"] = True
 
-    # Delete API keys
-    api_keys_file = os.path.join(DATA_DIR, "api_keys.json")
-    if os.path.exists(api_keys_file):
-        with open(api_keys_file, "r") as f:
-            keys = json.load(f)
-        original = len(keys)
-        keys = [k for k in keys if k.get("user_id") != user.id]
-        deleted["api_keys"] = original - len(keys)
-        with open(api_keys_file, "w") as f:
-            json.dump(keys, f, indent=2)
+    # Delete API keys (snapshot and WAL alike)
+    deleted["api_keys"] = revoke_user_api_keys(user.id)
+    invalidate_cached_user(user.id)
 
     audit_log(
         user_id=user.id, username=user.username,
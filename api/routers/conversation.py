@@ -140,9 +140,10 @@ async def search_conversations(
             if isinstance(content, list):
                 text_parts = [p.get("text", "") for p in content if isinstance(p, dict) and "text" in p]
                 content = "\n".join(text_parts)
-            if query_lower in content.lower():
+            # Lowercase once and let find() both test for and locate the match
+            idx = content.lower().find(query_lower)
+            if idx >= 0:
                 # Include snippet around match
-                idx = content.lower().find(query_lower)
                 start = max(0, idx - 50)
                 end = min(len(content), idx + len(q) + 50)
                 snippet = content[start:end]
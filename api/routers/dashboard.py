@@ -6,6 +6,8 @@ import time
 from fastapi import APIRouter
 from fastapi.responses import HTMLResponse
 
+from api.process_stats import process_sample
+
 router = APIRouter()
 
 _session_manager = None
@@ -42,13 +44,10 @@ async def health_dashboard():
     # Memory info
     mem_str = "N/A"
     cpu_str = "N/A"
-    try:
-        import psutil
-        proc = psutil.Process()
-        mem_str = f"{proc.memory_info().rss / 1024 / 1024:.1f} MB"
-        cpu_str = f"{proc.cpu_percent(interval=None):.1f}%"
-    except ImportError:
-        pass
+    sample = process_sample()
+    if sample is not None:
+        mem_str = f"{sample.rss_bytes / 1024 / 1024:.1f} MB"
+        cpu_str = f"{sample.cpu_percent:.1f}%"
 
     html = f"""<!DOCTYPE html>
 <html lang="en">
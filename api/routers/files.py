@@ -1,7 +1,6 @@
 """File upload endpoint: accept files for processing."""
 
 import os
-import uuid
 from datetime import datetime, timezone
 
 from fastapi import APIRouter, Depends, File, HTTPException, UploadFile
@@ -51,12 +50,17 @@ async def upload_file(
             detail=f"File type '{ext}' not allowed. Allowed: {', '.join(sorted(ALLOWED_EXTENSIONS))}",
         )
 
-    # Read file with size limit
-    contents = await file.read()
-    if len(contents) > MAX_FILE_SIZE:
+    # Read file with size limit. Starlette records the spooled size, so an
+    # oversized upload is rejected without loading it into memory; without
+    # it, read at most one byte past the limit.
+    size = file.size
+    if size is None or size <= MAX_FILE_SIZE:
+        contents = await file.read(MAX_FILE_SIZE + 1)
+        size = len(contents)
+    if size > MAX_FILE_SIZE:
         raise HTTPException(
             status_code=413,
-            detail=f"File too large ({len(contents)} bytes, max {MAX_FILE_SIZE})",
+            detail=f"File too large (max {MAX_FILE_SIZE} bytes)",
         )
 
     # Save to user-specific directory
@@ -64,7 +68,7 @@ async def upload_file(
     os.makedirs(user_dir, exist_ok=True)
 
     # Generate unique filename to prevent collisions
-    file_id = str(uuid.uuid4())[:8]
+    file_id = os.urandom(4).hex()
     safe_name = f"{file_id}_{file.filename}"
     file_path = os.path.join(user_dir, safe_name)
 
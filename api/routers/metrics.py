@@ -9,6 +9,8 @@ import time
 from fastapi import APIRouter
 from fastapi.responses import PlainTextResponse
 
+from api.process_stats import process_sample
+
 router = APIRouter()
 
 _session_manager = None
@@ -102,12 +104,9 @@ async def prometheus_metrics():
                 lines.append(f'jarvis_tool_duration_ms_total{{tool="{name}"}} {stats["duration_ms"]:.1f}')
 
     # Memory usage
-    try:
-        import psutil
-        process = psutil.Process()
-        gauge("jarvis_memory_rss_bytes", "Resident set size in bytes", process.memory_info().rss)
-        gauge("jarvis_cpu_percent", "CPU usage percentage", process.cpu_percent(interval=None))
-    except ImportError:
-        pass
+    sample = process_sample()
+    if sample is not None:
+        gauge("jarvis_memory_rss_bytes", "Resident set size in bytes", sample.rss_bytes)
+        gauge("jarvis_cpu_percent", "CPU usage percentage", sample.cpu_percent)
 
     return "\n".join(lines) + "\n"
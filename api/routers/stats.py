@@ -27,17 +27,10 @@ async def get_stats(user: UserInfo = Depends(get_current_user)):
     total_output = sum(s.conversation.total_output_tokens for s in sessions)
     total_tools = sum(s.conversation.total_tool_calls for s in sessions)
 
-    # Get tool count from any session or create one
-    if sessions:
-        tool_count = len(sessions[0].conversation.registry.all_tools())
-    else:
-        session = _session_manager.get_or_create(None, user.id)
-        tool_count = len(session.conversation.registry.all_tools())
-
     return StatsResponse(
         backend=config.backend,
         model=config.model,
-        tool_count=tool_count,
+        tool_count=_session_manager.tool_count,
         learnings_count=memory.count,
         active_sessions=_session_manager.active_session_count,
         uptime_seconds=_session_manager.uptime_seconds,
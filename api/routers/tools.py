@@ -61,8 +61,7 @@ def set_session_manager(sm):
 
 @router.get("/tools", response_model=ToolsResponse)
 async def list_tools(user: UserInfo = Depends(get_current_user)):
-    session = _session_manager.get_or_create(None, user.id)
-    tools = session.conversation.registry.all_tools()
+    tools = _session_manager.tool_catalog.all_tools()
 
     tool_list = [
         ToolInfo(
@@ -3,12 +3,13 @@
 import asyncio
 import json
 import logging
-import queue
 import threading
 from datetime import datetime, timezone
 
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 
+from api.enhanced_conversation import DONE_EVENT, AsyncEventQueue, StreamEvent
+
 log = logging.getLogger("jarvis.api.ws")
 router = APIRouter()
 
@@ -58,18 +59,20 @@ async def websocket_chat(websocket: WebSocket):
                 await websocket.send_json({"type": "error", "message": "Server not ready"})
                 continue
 
-            session = _session_manager.get_or_create(session_id, user_id)
+            session = await asyncio.get_event_loop().run_in_executor(
+                None, _session_manager.get_or_create, session_id, user_id
+            )
             await websocket.send_json({"type": "session", "session_id": session.session_id})
 
             # Run conversation in a thread, stream events via queue
-            event_queue: queue.Queue = queue.Queue()
+            event_queue = AsyncEventQueue()
 
             def run():
                 try:
                     session.conversation.send_stream(message, event_queue)
                 except Exception as e:
-                    event_queue.put({"event": "error", "data": {"message": str(e)}})
-                    event_queue.put({"event": "done", "data": {}})
+                    event_queue.put(StreamEvent("error", {"message": str(e)}))
+                    event_queue.put(DONE_EVENT)
 
             thread = threading.Thread(target=run, daemon=True)
             thread.start()
@@ -77,15 +80,12 @@ async def websocket_chat(websocket: WebSocket):
             # Forward events from queue to WebSocket
             while True:
                 try:
-                    event = await asyncio.get_event_loop().run_in_executor(
-                        None, lambda: event_queue.get(timeout=120)
-                    )
-                except queue.Empty:
+                    event = await event_queue.get(timeout=120)
+                except asyncio.TimeoutError:
                     await websocket.send_json({"type": "keepalive"})
                     continue
 
-                event_type = event.get("event", "")
-                event_data = event.get("data", {})
+                event_type, event_data = event
 
                 if event_type == "thinking":
                     await websocket.send_json({"type": "thinking", "status": event_data.get("status", "")})
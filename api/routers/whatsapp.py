@@ -56,15 +56,16 @@ async def whatsapp_bridge(body: BridgeRequest, request: Request):
 
     phone = body.phone
     user_id = f"wa_{phone}"
-    log.info("WhatsApp bridge from %s (%s): %s", body.name or phone, phone, body.message[:100])
+    if log.isEnabledFor(logging.INFO):
+        log.info("WhatsApp bridge from %s (%s): %s", body.name or phone, phone, body.message[:100])
 
     # Get or create session — prefer the one tracked server-side
     session_id = _phone_sessions.get(phone) or body.session_id
-    session = _session_manager.get_or_create(session_id, user_id)
+    loop = asyncio.get_event_loop()
+    session = await loop.run_in_executor(None, _session_manager.get_or_create, session_id, user_id)
     _phone_sessions[phone] = session.session_id
 
     try:
-        loop = asyncio.get_event_loop()
         response_text = await loop.run_in_executor(
             None, session.conversation.send, body.message
         )
@@ -73,7 +74,8 @@ async def whatsapp_bridge(body: BridgeRequest, request: Request):
         response_text = "Sorry, I encountered an error processing your request."
 
     raw_calls = session.conversation.get_and_clear_tool_calls()
-    log.info("WhatsApp bridge reply to %s: %s", phone, response_text[:100])
+    if log.isEnabledFor(logging.INFO):
+        log.info("WhatsApp bridge reply to %s: %s", phone, response_text[:100])
 
     return BridgeResponse(
         session_id=session.session_id,
@@ -44,13 +44,17 @@ class SessionManager:
         self._memory: Memory | None = None
         self._memory_lock = threading.Lock()
         self._start_time = datetime.now(timezone.utc)
+        self._tool_catalog: ToolRegistry | None = None
 
     def initialize(self):
-        """Load config and memory on startup."""
+        """Load config, memory and the tool catalog on startup."""
         project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
         os.chdir(project_root)
         self._config = Config.load()
         self._memory = Memory(path=os.path.join(project_root, "memory", "learnings.json"))
+        # Built here, before serving, so no request handler runs tool/plugin
+        # registration on the event loop
+        self._tool_catalog = self._build_registry()
 
     @property
     def config(self) -> Config:
@@ -70,9 +74,29 @@ class SessionManager:
     def active_session_count(self) -> int:
         return len(self._sessions)
 
+    @property
+    def tool_catalog(self) -> ToolRegistry:
+        """Registry with the tools every session gets, built once for listings and counts."""
+        assert self._tool_catalog is not None
+        return self._tool_catalog
+
+    @property
+    def tool_count(self) -> int:
+        return self.tool_catalog.tool_count
+
+    def _build_registry(self) -> ToolRegistry:
+        project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        registry = ToolRegistry()
+        from jarvis.tools import register_all
+        register_all(registry, self._config)
+        register_memory_tools(registry, self._memory)
+        # Skip plugins for local models -- too many tool schemas confuses small models
+        if self._config.backend != "ollama":
+            registry.load_plugins(os.path.join(project_root, "plugins"))
+        return registry
+
     def _create_session(self, user_id: str) -> JarvisSession:
         """Create a new Jarvis session for a user."""
-        project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
         backend = create_backend(self._config)
 
         with self._memory_lock:
@@ -81,13 +105,7 @@ class SessionManager:
         compact = self._config.backend == "ollama"
         system_prompt = build_system_prompt(self._config.system_prompt, memory_summary, compact=compact)
 
-        registry = ToolRegistry()
-        from jarvis.tools import register_all
-        register_all(registry, self._config)
-        register_memory_tools(registry, self._memory)
-        # Skip plugins for local models -- too many tool schemas confuses small models
-        if self._config.backend != "ollama":
-            registry.load_plugins(os.path.join(project_root, "plugins"))
+        registry = self._build_registry()
 
         convo = WebConversation(backend, registry, system_prompt, self._config.max_tokens,
                                use_tool_router=(self._config.backend == "ollama"))
@@ -5,16 +5,35 @@ import logging
 import os
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 
 import httpx
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
 log = logging.getLogger("jarvis.webhooks")
 
 DATA_DIR = os.path.join(os.path.dirname(__file__), "data")
 WEBHOOKS_FILE = os.path.join(DATA_DIR, "webhooks.json")
 _lock = threading.Lock()
 
+# One pooled client is shared by every delivery thread, so repeat events to the
+# same endpoint reuse a kept-alive (HTTP/2 where offered) connection instead of
+# paying a TCP+TLS handshake per POST.
+_DELIVERY_TIMEOUT = httpx.Timeout(10.0, connect=2.0)
+_DELIVERY_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=30.0)
+_client: httpx.Client | None = None
+_client_lock = threading.Lock()
+# Deliveries run on a bounded pool rather than a thread per hook per event, so
+# a burst of events queues behind _DELIVERY_WORKERS in-flight POSTs instead of
+# spawning hundreds of threads.
+_DELIVERY_WORKERS = 8
+_executor: ThreadPoolExecutor | None = None
+
 
 @dataclass
 class WebhookConfig:
@@ -24,25 +43,61 @@ class WebhookConfig:
     active: bool = True
 
 
-def _load_webhooks() -> dict[str, list[dict]]:
-    """Load all user webhook configs from disk."""
+# Parsed webhooks.json, keyed by the file's (inode, mtime, size) stamp so
+# fire_event() on the request path is a stat() instead of a JSON parse.
+_webhooks_cache: tuple[tuple, dict[str, list[dict]]] | None = None
+
+
+def _file_stamp(path: str) -> tuple[int, int, int] | None:
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+def _cached_webhooks() -> dict[str, list[dict]]:
+    """Return the shared parsed config; callers must not mutate it."""
+    global _webhooks_cache
     with _lock:
-        if not os.path.exists(WEBHOOKS_FILE):
-            return {}
-        with open(WEBHOOKS_FILE, "r", encoding="utf-8") as f:
-            return json.load(f)
+        stamp = (WEBHOOKS_FILE, _file_stamp(WEBHOOKS_FILE))
+        cached = _webhooks_cache
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        data: dict[str, list[dict]] = {}
+        if stamp[1] is not None:
+            with open(WEBHOOKS_FILE, "rb") as f:
+                data = _loads(f.read())
+        _webhooks_cache = (stamp, data)
+        return data
+
+
+def _dumps(obj) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def _loads(data: bytes):
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def _load_webhooks() -> dict[str, list[dict]]:
+    """Load all user webhook configs (a copy safe for read-modify-write)."""
+    return {user_id: list(hooks) for user_id, hooks in _cached_webhooks().items()}
 
 
 def _save_webhooks(data: dict) -> None:
+    global _webhooks_cache
     with _lock:
         os.makedirs(DATA_DIR, exist_ok=True)
         with open(WEBHOOKS_FILE, "w", encoding="utf-8") as f:
             json.dump(data, f, indent=2, ensure_ascii=False)
+        _webhooks_cache = None
 
 
 def get_user_webhooks(user_id: str) -> list[dict]:
-    all_hooks = _load_webhooks()
-    return all_hooks.get(user_id, [])
+    return list(_cached_webhooks().get(user_id, []))
 
 
 def add_webhook(user_id: str, url: str, events: list[str], secret: str = "") -> dict:
@@ -84,11 +139,38 @@ def fire_event(user_id: str, event: str, data: dict) -> None:
             continue
         if event not in hook.get("events", []) and "*" not in hook.get("events", []):
             continue
-        # Fire in background thread to not block the request
-        thread = threading.Thread(
-            target=_deliver, args=(hook, event, data), daemon=True
-        )
-        thread.start()
+        # Deliver in the background to not block the request
+        _get_executor().submit(_deliver, hook, event, data)
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        with _client_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=_DELIVERY_WORKERS, thread_name_prefix="webhook")
+    return _executor
+
+
+def _get_client() -> httpx.Client:
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = httpx.Client(http2=True, timeout=_DELIVERY_TIMEOUT, limits=_DELIVERY_LIMITS)
+    return _client
+
+
+def close_client() -> None:
+    """Drop queued deliveries and close the shared client (called on API shutdown)."""
+    global _client, _executor
+    with _client_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=False, cancel_futures=True)
+            _executor = None
+        if _client is not None:
+            _client.close()
+            _client = None
 
 
 def _deliver(hook: dict, event: str, data: dict) -> None:
@@ -100,15 +182,17 @@ def _deliver(hook: dict, event: str, data: dict) -> None:
         "timestamp": time.time(),
         "webhook_id": hook.get("id", ""),
     }
+    # Encode once and send exactly the bytes that were signed
+    body = _dumps(payload)
     headers = {"Content-Type": "application/json", "X-Jarvis-Event": event}
     if hook.get("secret"):
         import hashlib
         import hmac
-        sig = hmac.new(hook["secret"].encode(), json.dumps(payload).encode(), hashlib.sha256).hexdigest()
+        sig = hmac.new(hook["secret"].encode(), body, hashlib.sha256).hexdigest()
         headers["X-Jarvis-Signature"] = sig
 
     try:
-        resp = httpx.post(url, json=payload, headers=headers, timeout=10)
+        resp = _get_client().post(url, content=body, headers=headers)
         log.info("Webhook delivered to %s: %d", url, resp.status_code)
     except Exception as e:
         log.warning("Webhook delivery failed to %s: %s", url, e)
@@ -1,9 +1,10 @@
 from abc import ABC, abstractmethod
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from jarvis.tool_registry import ToolDef
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolCall:
     """Backend-agnostic representation of a tool call from the model."""
 
@@ -12,7 +13,7 @@ class ToolCall:
     args: dict
 
 
-@dataclass
+@dataclass(slots=True)
 class TokenUsage:
     """Token usage from a single API call."""
 
@@ -24,7 +25,7 @@ class TokenUsage:
         return self.input_tokens + self.output_tokens
 
 
-@dataclass
+@dataclass(slots=True)
 class BackendResponse:
     """What the backend returns after one API call."""
 
@@ -37,6 +38,13 @@ class BackendResponse:
 class Backend(ABC):
     """Common interface for all AI backends."""
 
+    # Backends that accept an ``on_text`` callback in send() and invoke it
+    # with text deltas as they arrive set this to True.
+    supports_streaming: bool = False
+
+    # (tools list, converted schemas) from the last send()
+    _schema_cache: tuple[list, object] | None = None
+
     @abstractmethod
     def send(
         self,
@@ -55,6 +63,19 @@ class Backend(ABC):
     @abstractmethod
     def format_tool_results(self, results: list[tuple[str, str]]) -> dict | list[dict]: ...
 
+    def _tool_schemas(self, tools: list[ToolDef], build: Callable[[list[ToolDef]], object]):
+        """Return ``build(tools)``, reusing the last result for the same list object.
+
+        Conversation hands every turn the same tools list until the registry
+        changes, so the tool loop converts schemas once instead of per call.
+        """
+        cached = self._schema_cache
+        if cached is not None and cached[0] is tools:
+            return cached[1]
+        schemas = build(tools)
+        self._schema_cache = (tools, schemas)
+        return schemas
+
     def ping(self) -> bool:
         """Check backend connectivity with a minimal API call.
 
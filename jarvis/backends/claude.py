@@ -3,22 +3,66 @@ from .base import Backend, BackendResponse, TokenUsage, ToolCall
 from jarvis.retry import retry_api_call
 from jarvis.tool_registry import ToolDef
 
+# Seconds without a single streamed chunk before the connection is considered stalled
+STREAM_STALL_TIMEOUT = 30.0
+
+
+class StreamInterrupted(RuntimeError):
+    """A stream failed after text was already delivered; not safe to retry."""
+
 
 class ClaudeBackend(Backend):
+    supports_streaming = True
+
     def __init__(self, api_key: str, model: str = "claude-sonnet-4-5-20250929"):
         self.client = anthropic.Anthropic(api_key=api_key)
         self.model = model
 
-    def send(self, messages, system, tools, max_tokens=4096):
-        tool_schemas = [t.schema_anthropic() for t in tools]
-        response = retry_api_call(
-            self.client.messages.create,
-            model=self.model,
-            max_tokens=max_tokens,
-            system=system,
-            tools=tool_schemas,
-            messages=messages,
-        )
+    def send(self, messages, system, tools, max_tokens=4096, on_text=None):
+        tool_schemas = self._tool_schemas(tools, lambda ts: [t.schema_anthropic() for t in ts])
+        if on_text is not None:
+            response = retry_api_call(
+                self._stream,
+                on_text=on_text,
+                model=self.model,
+                max_tokens=max_tokens,
+                system=system,
+                tools=tool_schemas,
+                messages=messages,
+            )
+        else:
+            response = retry_api_call(
+                self.client.messages.create,
+                model=self.model,
+                max_tokens=max_tokens,
+                system=system,
+                tools=tool_schemas,
+                messages=messages,
+            )
+        return self._parse_response(response)
+
+    def _stream(self, on_text, **kwargs):
+        """Stream a message, passing text deltas to on_text; return the final message.
+
+        The read timeout acts as a dead-man switch: if no chunk arrives within
+        STREAM_STALL_TIMEOUT seconds the request fails instead of hanging.
+        """
+        emitted = False
+        timeout = anthropic.Timeout(600.0, read=STREAM_STALL_TIMEOUT)
+        try:
+            with self.client.messages.stream(timeout=timeout, **kwargs) as stream:
+                for text in stream.text_stream:
+                    emitted = True
+                    on_text(text)
+                return stream.get_final_message()
+        except Exception as e:
+            if emitted:
+                # Retrying would replay text the caller already rendered
+                raise StreamInterrupted("stream ended after partial output") from e
+            raise
+
+    @staticmethod
+    def _parse_response(response) -> BackendResponse:
         text = None
         tool_calls = []
         for block in response.content:
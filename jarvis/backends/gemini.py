@@ -21,17 +21,7 @@ class GeminiBackend(Backend):
         self.model_name = model
 
     def send(self, messages, system, tools, max_tokens=4096):
-        func_decls = []
-        for t in tools:
-            schema = t.schema_gemini()
-            func_decls.append(
-                genai_types.FunctionDeclaration(
-                    name=schema["name"],
-                    description=schema["description"],
-                    parameters=schema["parameters"],
-                )
-            )
-        gemini_tools = [genai_types.Tool(function_declarations=func_decls)]
+        gemini_tools = self._tool_schemas(tools, self._build_tools)
 
         model = genai.GenerativeModel(
             model_name=self.model_name,
@@ -63,6 +53,20 @@ class GeminiBackend(Backend):
             )
         return BackendResponse(text=text, tool_calls=tool_calls, raw=response, usage=usage)
 
+    @staticmethod
+    def _build_tools(tools: list[ToolDef]) -> list:
+        func_decls = []
+        for t in tools:
+            schema = t.schema_gemini()
+            func_decls.append(
+                genai_types.FunctionDeclaration(
+                    name=schema["name"],
+                    description=schema["description"],
+                    parameters=schema["parameters"],
+                )
+            )
+        return [genai_types.Tool(function_declarations=func_decls)]
+
     def format_user_message(self, text):
         return genai_types.ContentDict(role="user", parts=[text])
 
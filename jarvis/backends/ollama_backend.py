@@ -50,7 +50,7 @@ class OllamaBackend(Backend):
         }
 
         # Add tools if model supports them
-        tool_schemas = self._build_tool_schemas(tools)
+        tool_schemas = self._tool_schemas(tools, self._build_tool_schemas)
         if tool_schemas:
             payload["tools"] = tool_schemas
 
@@ -15,7 +15,7 @@ class OpenAIBackend(Backend):
     def send(self, messages, system, tools, max_tokens=4096):
         # OpenAI uses a system message prepended to the conversation
         full_messages = [{"role": "system", "content": system}] + messages
-        tool_schemas = [t.schema_openai() for t in tools]
+        tool_schemas = self._tool_schemas(tools, lambda ts: [t.schema_openai() for t in ts])
 
         response = retry_api_call(
             self.client.chat.completions.create,
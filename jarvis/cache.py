@@ -7,7 +7,7 @@ import time
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class CacheEntry:
     """A cached value with expiration."""
 
@@ -13,24 +13,28 @@ log = logging.getLogger("jarvis.context")
 CHARS_PER_TOKEN = 4
 
 
+def message_chars(msg: dict) -> int:
+    """Character count of one message's content, as used by estimate_tokens."""
+    content = msg.get("content", "")
+    if isinstance(content, str):
+        return len(content)
+    total_chars = 0
+    if isinstance(content, list):
+        for block in content:
+            if isinstance(block, dict):
+                total_chars += len(str(block.get("text", "")))
+            else:
+                total_chars += len(str(block))
+    return total_chars
+
+
 def estimate_tokens(messages: list[dict]) -> int:
     """Estimate the total token count of a message list.
 
     Uses a simple character-based heuristic. Not exact, but good enough
     for deciding when to summarize.
     """
-    total_chars = 0
-    for msg in messages:
-        content = msg.get("content", "")
-        if isinstance(content, str):
-            total_chars += len(content)
-        elif isinstance(content, list):
-            for block in content:
-                if isinstance(block, dict):
-                    total_chars += len(str(block.get("text", "")))
-                else:
-                    total_chars += len(str(block))
-    return total_chars // CHARS_PER_TOKEN
+    return sum(map(message_chars, messages)) // CHARS_PER_TOKEN
 
 
 def summarize_messages(messages: list[dict], keep_recent: int = 20) -> tuple[list[dict], int]:
@@ -1,14 +1,26 @@
 import copy
 from datetime import datetime, timezone
+from typing import NamedTuple
 
 from jarvis.backends.base import Backend
-from jarvis.context_manager import estimate_tokens, summarize_messages
+from jarvis.context_manager import CHARS_PER_TOKEN, message_chars, summarize_messages
 from jarvis.logger import log
 from jarvis.parallel import execute_tools_parallel
 from jarvis.tool_registry import ToolRegistry
 from jarvis.tool_router import select_tools
 
 
+class StreamEvent(NamedTuple):
+    """One send_stream event: its *name* (thinking, tool_call, ...) and JSON-able *data*."""
+
+    name: str
+    data: dict
+
+
+# Consumers only read event data, so the payload-free event can be shared
+DONE_EVENT = StreamEvent("done", {})
+
+
 class Conversation:
     """Manages conversation history and the agent tool loop, backend-agnostic."""
 
@@ -29,6 +41,28 @@ class Conversation:
         self.total_input_tokens: int = 0
         self.total_output_tokens: int = 0
         self._checkpoints: list[dict] = []
+        # all_tools() snapshot and the registry version it was taken at
+        self._tools_cache: list | None = None
+        self._tools_version = -1
+        # (messages list, count, last counted message, chars) for the running
+        # history size, so each turn only measures the messages it added
+        self._history_size: tuple[list, int, object, int] | None = None
+
+    def _history_chars(self) -> int:
+        """Total message_chars() of self.messages, extended incrementally.
+
+        Falls back to a full count when the list was replaced or rewritten
+        (summarized, restored, cleared) rather than appended to.
+        """
+        msgs = self.messages
+        count, chars = 0, 0
+        if self._history_size is not None:
+            seen, seen_count, last, seen_chars = self._history_size
+            if seen is msgs and seen_count <= len(msgs) and (seen_count == 0 or msgs[seen_count - 1] is last):
+                count, chars = seen_count, seen_chars
+        chars += sum(map(message_chars, msgs[count:]))
+        self._history_size = (msgs, len(msgs), msgs[-1] if msgs else None, chars)
+        return chars
 
     def _trim_history(self):
         """Trim old messages to stay within limits, using smart summarization.
@@ -36,28 +70,36 @@ class Conversation:
         First tries to summarize if the context window is getting large.
         Falls back to simple truncation if still over MAX_MESSAGES.
         """
-        # Smart summarization when token estimate is high
-        est_tokens = estimate_tokens(self.messages)
-        if est_tokens > self.CONTEXT_TOKEN_THRESHOLD and len(self.messages) > 20:
-            self.messages, removed = summarize_messages(self.messages, keep_recent=20)
-            if removed > 0:
-                log.info("Context management: summarized %d messages (est. %d tokens)", removed, est_tokens)
-                return
+        # Smart summarization when token estimate is high. Short histories can't
+        # be summarized anyway, so skip walking every message to estimate them.
+        if len(self.messages) > 20:
+            est_tokens = self._history_chars() // CHARS_PER_TOKEN
+            if est_tokens > self.CONTEXT_TOKEN_THRESHOLD:
+                self.messages, removed = summarize_messages(self.messages, keep_recent=20)
+                if removed > 0:
+                    log.info("Context management: summarized %d messages (est. %d tokens)", removed, est_tokens)
+                    return
 
-        # Fallback: simple truncation
+        # Fallback: simple truncation, in place so the list isn't rebuilt
         if len(self.messages) <= self.MAX_MESSAGES:
             return
         trimmed_count = len(self.messages) - self.MAX_MESSAGES
-        self.messages = self.messages[-self.MAX_MESSAGES:]
+        chars = self._history_chars() - sum(map(message_chars, self.messages[:trimmed_count]))
+        del self.messages[:trimmed_count]
+        self._history_size = (self.messages, len(self.messages), self.messages[-1], chars)
         log.info("Trimmed %d old messages from conversation history", trimmed_count)
 
-    def _call_backend(self, tools):
+    def _call_backend(self, tools, on_text=None):
         """Call backend — retry logic now lives in each backend via jarvis.retry."""
+        kwargs = {}
+        if on_text is not None and self.backend.supports_streaming:
+            kwargs["on_text"] = on_text
         return self.backend.send(
             messages=self.messages,
             system=self.system,
             tools=tools,
             max_tokens=self.max_tokens,
+            **kwargs,
         )
 
     def _resolve_tools(self, user_input: str) -> list:
@@ -71,16 +113,23 @@ class Conversation:
             log.info("Tool router selected %d tools: %s",
                      len(routed), [t.name for t in routed])
             return routed
-        return self.registry.all_tools()
+        if self._tools_version != self.registry.version:
+            self._tools_cache = self.registry.all_tools()
+            self._tools_version = self.registry.version
+        return self._tools_cache
+
+    def send(self, user_input: str, on_text=None) -> str:
+        """Send a message, run the tool loop, return the final text response.
 
-    def send(self, user_input: str) -> str:
-        """Send a message, run the tool loop, return the final text response."""
+        If *on_text* is given and the backend supports streaming, it is called
+        with each text delta as it arrives so callers can render incrementally.
+        """
         self.messages.append(self.backend.format_user_message(user_input))
         tools = self._resolve_tools(user_input)
         turns = 0
 
         while True:
-            response = self._call_backend(tools)
+            response = self._call_backend(tools, on_text)
             self.total_input_tokens += response.usage.input_tokens
             self.total_output_tokens += response.usage.output_tokens
 
@@ -115,7 +164,7 @@ class Conversation:
     def send_stream(self, user_input: str, event_queue) -> None:
         """Send a message with tool loop, emitting SSE events to event_queue.
 
-        Events emitted:
+        Each event is a StreamEvent(name, data). Events emitted:
             thinking  - {"status": "Processing your request..."}
             tool_call - {"id": str, "name": str, "args": dict}
             tool_result - {"id": str, "result": str}
@@ -126,7 +175,7 @@ class Conversation:
         tools = self._resolve_tools(user_input)
         turns = 0
 
-        event_queue.put({"event": "thinking", "data": {"status": "Processing your request..."}})
+        event_queue.put(StreamEvent("thinking", {"status": "Processing your request..."}))
 
         while True:
             response = self._call_backend(tools)
@@ -138,20 +187,20 @@ class Conversation:
                 if turns > self.MAX_TOOL_TURNS:
                     self.messages.append(self.backend.format_assistant_message(response))
                     text = f"(Stopped after {self.MAX_TOOL_TURNS} tool turns to prevent runaway loop. Last response: {response.text or ''})"
-                    event_queue.put({"event": "text", "data": {"content": text}})
-                    event_queue.put({"event": "done", "data": {}})
+                    event_queue.put(StreamEvent("text", {"content": text}))
+                    event_queue.put(DONE_EVENT)
                     return
 
                 self.messages.append(self.backend.format_assistant_message(response))
 
-                # Execute tools and emit events
-                results = []
+                # Announce every call up front, then run them concurrently so a
+                # multi-tool turn takes as long as its slowest tool, not the sum
                 for tc in response.tool_calls:
-                    event_queue.put({"event": "tool_call", "data": {"id": tc.id, "name": tc.name, "args": tc.args}})
+                    event_queue.put(StreamEvent("tool_call", {"id": tc.id, "name": tc.name, "args": tc.args}))
                     log.info("tool call: %s", tc.name)
-                    result = self.registry.handle_call(tc.name, tc.args)
-                    results.append((tc.id, result))
-                    event_queue.put({"event": "tool_result", "data": {"id": tc.id, "result": result}})
+                results = execute_tools_parallel(self.registry, response.tool_calls)
+                for tid, result in results:
+                    event_queue.put(StreamEvent("tool_result", {"id": tid, "result": result}))
 
                 tool_msg = self.backend.format_tool_results(results)
                 if isinstance(tool_msg, list):
@@ -159,12 +208,12 @@ class Conversation:
                 else:
                     self.messages.append(tool_msg)
 
-                event_queue.put({"event": "thinking", "data": {"status": "Processing tool results..."}})
+                event_queue.put(StreamEvent("thinking", {"status": "Processing tool results..."}))
             else:
                 self.messages.append(self.backend.format_assistant_message(response))
                 self._trim_history()
-                event_queue.put({"event": "text", "data": {"content": response.text or ""}})
-                event_queue.put({"event": "done", "data": {}})
+                event_queue.put(StreamEvent("text", {"content": response.text or ""}))
+                event_queue.put(DONE_EVENT)
                 return
 
     def save_checkpoint(self, label: str = "") -> dict:
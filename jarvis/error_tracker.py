@@ -4,6 +4,7 @@ Tracks error rates over sliding time windows and triggers alerts
 when thresholds are exceeded.
 """
 
+import itertools
 import logging
 import threading
 import time
@@ -89,11 +90,12 @@ class ErrorTracker:
 
     def get_recent_errors(self, limit: int = 20) -> list[dict]:
         """Get recent errors for display."""
+        # Walk back from the newest entry instead of copying the whole window
         with self._lock:
-            recent = list(self._errors)[-limit:]
+            recent = list(itertools.islice(reversed(self._errors), max(limit, 0)))
         return [
             {"timestamp": ts, "category": cat, "message": msg[:500]}
-            for ts, cat, msg in reversed(recent)
+            for ts, cat, msg in recent
         ]
 
     def get_stats(self) -> dict:
@@ -1,7 +1,40 @@
 import json
+import mmap
 import os
 from datetime import datetime, timezone
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
+
+def _read_json(path: str):
+    """Parse a JSON file via a read-only memory map, using orjson when available."""
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            raise json.JSONDecodeError("Expecting value", "", 0)
+        if hasattr(mmap, "MAP_POPULATE"):
+            # Linux: prefault the pages so the parser never takes page faults
+            mm = mmap.mmap(f.fileno(), size, flags=mmap.MAP_SHARED | mmap.MAP_POPULATE,
+                           prot=mmap.PROT_READ)
+        else:
+            mm = mmap.mmap(f.fileno(), size, access=mmap.ACCESS_READ)
+    with mm:
+        if orjson is not None:
+            with memoryview(mm) as view:
+                return orjson.loads(view)
+        return json.loads(mm[:])
+
+
+_SEARCH_FIELDS = ("category", "insight", "context", "task_description")
+
+
+def _search_key(entry: dict) -> str:
+    """Lowercased searchable fields, NUL-joined so a topic can't match across two fields."""
+    return "\0".join(entry.get(field, "") for field in _SEARCH_FIELDS).lower()
+
 
 class Memory:
     """Persistent memory for learnings across sessions."""
@@ -11,13 +44,15 @@ class Memory:
         self._learnings: list[dict] = []
         self._summary_cache: str | None = None
         self._summary_cache_count: int = 0
+        # Lowercased searchable text per learning, built on first get_relevant()
+        self._search_keys: list[str] | None = None
         self.load()
 
     def load(self) -> None:
         """Load learnings from disk."""
+        self._search_keys = None
         if os.path.exists(self.path):
-            with open(self.path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = _read_json(self.path)
             # Handle both formats: plain list or {"learnings": [...]}
             if isinstance(data, dict):
                 self._learnings = data.get("learnings", [])
@@ -50,6 +85,8 @@ class Memory:
             "task_description": task_description,
         }
         self._learnings.append(entry)
+        if self._search_keys is not None:
+            self._search_keys.append(_search_key(entry))
         self._save()
         self._summary_cache = None  # Invalidate cache
         return entry
@@ -82,14 +119,9 @@ class Memory:
     def get_relevant(self, topic: str) -> list[dict]:
         """Return learnings matching a topic keyword across all fields."""
         topic_lower = topic.lower()
-        return [
-            e
-            for e in self._learnings
-            if topic_lower in e.get("category", "").lower()
-            or topic_lower in e.get("insight", "").lower()
-            or topic_lower in e.get("context", "").lower()
-            or topic_lower in e.get("task_description", "").lower()
-        ]
+        if self._search_keys is None or len(self._search_keys) != len(self._learnings):
+            self._search_keys = [_search_key(e) for e in self._learnings]
+        return [e for e, key in zip(self._learnings, self._search_keys) if topic_lower in key]
 
     @property
     def count(self) -> int:
@@ -6,7 +6,8 @@ this module can execute them in parallel using a thread pool.
 
 import logging
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections.abc import Callable
+from concurrent.futures import Executor, ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 
 log = logging.getLogger("jarvis.parallel")
@@ -15,7 +16,7 @@ log = logging.getLogger("jarvis.parallel")
 DEFAULT_MAX_WORKERS = 4
 
 
-@dataclass
+@dataclass(slots=True)
 class ParallelResult:
     """Result of a single parallel tool execution."""
 
@@ -26,10 +27,30 @@ class ParallelResult:
     success: bool
 
 
+def _run_batch(executor, registry, tool_calls, on_result, results_by_index) -> None:
+    future_to_index = {}
+    for i, tc in enumerate(tool_calls):
+        future = executor.submit(registry.handle_call, tc.name, tc.args)
+        future_to_index[future] = (i, tc)
+
+    for future in as_completed(future_to_index):
+        idx, tc = future_to_index[future]
+        try:
+            result = future.result()
+        except Exception as e:
+            log.exception("Parallel tool %s raised exception", tc.name)
+            result = f"Tool error ({tc.name}): {e}"
+        if on_result is not None:
+            on_result(tc, result)
+        results_by_index[idx] = (tc.id, result)
+
+
 def execute_tools_parallel(
     registry,
     tool_calls: list,
     max_workers: int = DEFAULT_MAX_WORKERS,
+    on_result: Callable[[object, str], None] | None = None,
+    executor: Executor | None = None,
 ) -> list[tuple[str, str]]:
     """Execute multiple tool calls in parallel.
 
@@ -37,6 +58,11 @@ def execute_tools_parallel(
         registry: ToolRegistry instance.
         tool_calls: List of ToolCall objects (id, name, args).
         max_workers: Maximum number of concurrent executions.
+        on_result: Optional callback ``(tool_call, result)``, invoked in the
+            calling thread as each call finishes (completion order).
+        executor: Optional long-lived pool to submit to instead of starting
+            (and tearing down) a fresh one for this batch. It is not shut
+            down here, and *max_workers* does not apply to it.
 
     Returns:
         List of (tool_call_id, result) tuples in the same order as input.
@@ -46,6 +72,8 @@ def execute_tools_parallel(
         results = []
         for tc in tool_calls:
             result = registry.handle_call(tc.name, tc.args)
+            if on_result is not None:
+                on_result(tc, result)
             results.append((tc.id, result))
         return results
 
@@ -55,20 +83,11 @@ def execute_tools_parallel(
     # Map future -> index to preserve ordering
     results_by_index: dict[int, tuple[str, str]] = {}
 
-    with ThreadPoolExecutor(max_workers=min(max_workers, len(tool_calls))) as executor:
-        future_to_index = {}
-        for i, tc in enumerate(tool_calls):
-            future = executor.submit(registry.handle_call, tc.name, tc.args)
-            future_to_index[future] = (i, tc)
-
-        for future in as_completed(future_to_index):
-            idx, tc = future_to_index[future]
-            try:
-                result = future.result()
-            except Exception as e:
-                log.exception("Parallel tool %s raised exception", tc.name)
-                result = f"Tool error ({tc.name}): {e}"
-            results_by_index[idx] = (tc.id, result)
+    if executor is not None:
+        _run_batch(executor, registry, tool_calls, on_result, results_by_index)
+    else:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(tool_calls))) as pool:
+            _run_batch(pool, registry, tool_calls, on_result, results_by_index)
 
     total_ms = (time.perf_counter() - start) * 1000
     log.info("Parallel execution of %d tools completed in %.0fms", len(tool_calls), total_ms)
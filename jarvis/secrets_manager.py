@@ -1,10 +1,12 @@
 """Encrypted secrets management for API keys and sensitive configuration.
 
-Uses Fernet symmetric encryption (AES-128-CBC with HMAC-SHA256).
+Uses AES-256-GCM authenticated encryption; values written by older versions
+with Fernet (AES-128-CBC with HMAC-SHA256) are still decrypted.
 The master key is derived from JARVIS_MASTER_KEY env var or auto-generated.
 """
 
 import base64
+import functools
 import hashlib
 import json
 import logging
@@ -49,12 +51,35 @@ def _get_master_key() -> bytes:
     return key
 
 
+# Prefix of values encrypted with AES-GCM; unprefixed values are Fernet tokens
+_GCM_PREFIX = "gcm:"
+_GCM_NONCE_BYTES = 12
+
+
+@functools.lru_cache(maxsize=4)
+def _aead(master_key: bytes):
+    """AES-GCM cipher for a (Fernet-format) master key, built once per key.
+
+    The GCM key is a separate 256-bit key derived from the master key.
+    """
+    from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+    return AESGCM(hashlib.sha256(b"jarvis-secrets-aes-gcm\0" + base64.urlsafe_b64decode(master_key)).digest())
+
+
+@functools.lru_cache(maxsize=4)
+def _fernet(master_key: bytes):
+    """Fernet instance for decrypting values written before AES-GCM."""
+    from cryptography.fernet import Fernet
+    return Fernet(master_key)
+
+
 def _encrypt(plaintext: str) -> str:
     """Encrypt a string value."""
     try:
-        from cryptography.fernet import Fernet
-        f = Fernet(_get_master_key())
-        return f.encrypt(plaintext.encode()).decode()
+        aead = _aead(_get_master_key())
+        nonce = os.urandom(_GCM_NONCE_BYTES)
+        sealed = aead.encrypt(nonce, plaintext.encode(), None)
+        return _GCM_PREFIX + base64.urlsafe_b64encode(nonce + sealed).decode()
     except ImportError:
         # Fallback: base64 encoding (not truly secure, warns user)
         log.warning("cryptography package not installed; secrets stored with base64 only")
@@ -66,9 +91,11 @@ def _decrypt(ciphertext: str) -> str:
     if ciphertext.startswith("b64:"):
         return base64.b64decode(ciphertext[4:]).decode()
     try:
-        from cryptography.fernet import Fernet
-        f = Fernet(_get_master_key())
-        return f.decrypt(ciphertext.encode()).decode()
+        if ciphertext.startswith(_GCM_PREFIX):
+            raw = base64.urlsafe_b64decode(ciphertext[len(_GCM_PREFIX):])
+            aead = _aead(_get_master_key())
+            return aead.decrypt(raw[:_GCM_NONCE_BYTES], raw[_GCM_NONCE_BYTES:], None).decode()
+        return _fernet(_get_master_key()).decrypt(ciphertext.encode()).decode()
     except ImportError:
         log.error("Cannot decrypt: cryptography package not installed")
         return ""
@@ -1,9 +1,14 @@
+import bisect
+import functools
 import importlib.util
+import json
 import logging
+import operator
 import os
+import stat
 import time
 from dataclasses import dataclass, field
-from typing import Callable
+from typing import Callable, Iterable
 
 log = logging.getLogger("jarvis.tools")
 
@@ -19,6 +24,16 @@ class ToolDef:
     category: str = "general"  # Tool category for grouping/filtering
     retryable: bool = False  # If True, transient failures are retried once
 
+    @functools.cached_property
+    def props(self) -> dict:
+        """The ``properties`` mapping from the parameter schema."""
+        return self.parameters.get("properties", {})
+
+    @functools.cached_property
+    def required(self) -> frozenset[str]:
+        """Names of the required parameters."""
+        return frozenset(self.parameters.get("required", ()))
+
     def schema_anthropic(self) -> dict:
         return {
             "name": self.name,
@@ -72,6 +87,22 @@ class ToolStats:
         return self.total_duration_ms / self.call_count if self.call_count else 0.0
 
 
+_tool_name = operator.attrgetter("name")
+
+
+@functools.lru_cache(maxsize=32)
+def _discover_plugin_files(plugins_dir: str, dir_mtime_ns: int) -> tuple[str, ...]:
+    """Return sorted plugin filenames in plugins_dir.
+
+    Keyed on the directory mtime so adding/removing a plugin invalidates the entry.
+    """
+    return tuple(
+        filename
+        for filename in sorted(os.listdir(plugins_dir))
+        if not filename.startswith("_") and filename.endswith(".py")
+    )
+
+
 class ToolRegistry:
     """Collects tools and handles dispatch."""
 
@@ -80,25 +111,83 @@ class ToolRegistry:
 
     def __init__(self):
         self._tools: dict[str, ToolDef] = {}
+        # category -> tools in that category, kept sorted by name
+        self._by_category: dict[str, list[ToolDef]] = {}
         self._stats: dict[str, ToolStats] = {}
         self._cache = None  # Lazy-initialized ToolCache
+        # Deferred tool loaders: (categories they provide, loader(registry))
+        self._pending: list[tuple[frozenset[str], Callable[["ToolRegistry"], None]]] = []
+        # Bumped whenever the tool set may have changed; lets callers cache all_tools()
+        self.version = 0
 
     def register(self, tool: ToolDef) -> None:
+        previous = self._tools.get(tool.name)
+        if previous is not None:
+            bucket = self._by_category[previous.category]
+            bucket.remove(previous)
+            if not bucket:
+                del self._by_category[previous.category]
         self._tools[tool.name] = tool
+        self.version += 1
+        bisect.insort(self._by_category.setdefault(tool.category, []), tool, key=_tool_name)
+
+    def register_lazy(self, categories: Iterable[str], loader: Callable[["ToolRegistry"], None]) -> None:
+        """Defer a loader until a tool from one of its categories is needed.
+
+        An empty ``categories`` means the loader's categories are unknown
+        (e.g. plugins), so it runs on any category request.
+        """
+        self._pending.append((frozenset(categories), loader))
+        self.version += 1
+
+    def ensure_category(self, category: str) -> None:
+        """Run only the pending loaders that provide the given category."""
+        if not self._pending:
+            return
+        remaining = []
+        to_run = []
+        for cats, loader in self._pending:
+            (to_run if not cats or category in cats else remaining).append((cats, loader))
+        self._pending = remaining
+        for _, loader in to_run:
+            loader(self)
+
+    def _load_pending(self) -> None:
+        """Run every pending loader so the registry is fully populated."""
+        while self._pending:
+            _, loader = self._pending.pop(0)
+            loader(self)
 
     def get(self, name: str) -> ToolDef | None:
+        if name not in self._tools:
+            self._load_pending()
         return self._tools.get(name)
 
     def all_tools(self) -> list[ToolDef]:
+        self._load_pending()
         return list(self._tools.values())
 
+    @property
+    def tool_count(self) -> int:
+        """Number of registered tools, without building a list."""
+        self._load_pending()
+        return len(self._tools)
+
     def tools_by_category(self, category: str) -> list[ToolDef]:
-        """Return all tools matching a category."""
-        return [t for t in self._tools.values() if t.category == category]
+        """Return all tools matching a category, sorted by name."""
+        self.ensure_category(category)
+        return list(self._by_category.get(category, ()))
+
+    def sorted_tools(self) -> list[ToolDef]:
+        """Return all tools ordered by (category, name)."""
+        self._load_pending()
+        by_category = self._by_category
+        return [t for cat in sorted(by_category) for t in by_category[cat]]
 
     def categories(self) -> list[str]:
         """Return all unique tool categories."""
-        return sorted(set(t.category for t in self._tools.values()))
+        self._load_pending()
+        return sorted(self._by_category)
 
     def _get_cache(self):
         """Lazy-init the cache to avoid import cycles."""
@@ -108,7 +197,7 @@ class ToolRegistry:
         return self._cache
 
     def handle_call(self, name: str, args: dict) -> str:
-        tool = self._tools.get(name)
+        tool = self.get(name)
         if tool is None:
             return f"Unknown tool: {name}"
         # Validate required parameters
@@ -180,22 +269,137 @@ class ToolRegistry:
 
         register_all(self)
 
-    def load_plugins(self, plugins_dir: str) -> None:
-        """Load .py files from plugins_dir. Each must define register(registry)."""
-        if not os.path.isdir(plugins_dir):
+    def load_plugins(self, plugins_dir: str, use_cache: bool = False) -> None:
+        """Load .py files from plugins_dir. Each must define register(registry).
+
+        With ``use_cache=True`` the tool schemas of each plugin are persisted
+        in ``PLUGIN_CACHE_FILE`` keyed by file mtime/size; unchanged plugins are
+        then registered from that cache without executing the module, and the
+        module is only imported the first time one of its tools is called.
+        Only suitable for callers that mostly need tool metadata.
+        """
+        try:
+            st = os.stat(plugins_dir)
+        except OSError:
+            return
+        if not stat.S_ISDIR(st.st_mode):
             return
-        for filename in sorted(os.listdir(plugins_dir)):
-            if filename.startswith("_") or not filename.endswith(".py"):
-                continue
+        cache_path = os.path.join(plugins_dir, PLUGIN_CACHE_FILE)
+        cache = _read_plugin_cache(cache_path) if use_cache else {}
+        new_cache: dict[str, dict] = {}
+        for filename in _discover_plugin_files(plugins_dir, st.st_mtime_ns):
             filepath = os.path.join(plugins_dir, filename)
-            module_name = f"plugins.{filename[:-3]}"
-            spec = importlib.util.spec_from_file_location(module_name, filepath)
-            module = importlib.util.module_from_spec(spec)
-            try:
-                spec.loader.exec_module(module)
-                if hasattr(module, "register"):
-                    module.register(self)
-                else:
-                    log.warning("Plugin %s has no register() function, skipping.", filename)
-            except Exception as e:
-                log.warning("Failed to load plugin %s: %s", filename, e)
+            if use_cache:
+                try:
+                    fst = os.stat(filepath)
+                except OSError:
+                    continue
+                stamp = [fst.st_mtime_ns, fst.st_size]
+                entry = cache.get(filename)
+                if entry is not None and entry.get("stamp") == stamp:
+                    for spec in entry["tools"]:
+                        self.register(ToolDef(
+                            func=_deferred_plugin_func(filepath, spec["name"]), **spec,
+                        ))
+                    new_cache[filename] = entry
+                    continue
+                recorder = _RecordingRegistry(self)
+                if self._exec_plugin(filename, filepath, recorder):
+                    tools = recorder.tool_specs()
+                    if tools is not None:
+                        new_cache[filename] = {"stamp": stamp, "tools": tools}
+            else:
+                self._exec_plugin(filename, filepath, self)
+        if use_cache and new_cache != cache:
+            _write_plugin_cache(cache_path, new_cache)
+
+    @staticmethod
+    def _exec_plugin(filename: str, filepath: str, target) -> bool:
+        """Execute one plugin file and call its register(target). Returns success."""
+        module_name = f"plugins.{filename[:-3]}"
+        spec = importlib.util.spec_from_file_location(module_name, filepath)
+        module = importlib.util.module_from_spec(spec)
+        try:
+            spec.loader.exec_module(module)
+            if hasattr(module, "register"):
+                module.register(target)
+                return True
+            log.warning("Plugin %s has no register() function, skipping.", filename)
+        except Exception as e:
+            log.warning("Failed to load plugin %s: %s", filename, e)
+        return False
+
+
+# Per-plugin schema cache written next to the plugins by load_plugins(use_cache=True)
+PLUGIN_CACHE_FILE = ".cache.json"
+
+
+def _read_plugin_cache(path: str) -> dict:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _write_plugin_cache(path: str, data: dict) -> None:
+    tmp = f"{path}.tmp"
+    try:
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp, path)
+    except OSError as e:
+        log.debug("Could not write plugin cache %s: %s", path, e)
+
+
+class _RecordingRegistry:
+    """Forwards register() to a real registry while recording tool metadata."""
+
+    def __init__(self, target: ToolRegistry):
+        self._target = target
+        self._tools: list[ToolDef] = []
+
+    def register(self, tool: ToolDef) -> None:
+        self._tools.append(tool)
+        self._target.register(tool)
+
+    def __getattr__(self, name):
+        return getattr(self._target, name)
+
+    def tool_specs(self) -> list[dict] | None:
+        """Return JSON-safe tool metadata, or None if a schema can't be cached."""
+        specs = [
+            {
+                "name": t.name,
+                "description": t.description,
+                "parameters": t.parameters,
+                "category": t.category,
+                "retryable": t.retryable,
+            }
+            for t in self._tools
+        ]
+        try:
+            json.dumps(specs)
+        except (TypeError, ValueError):
+            return None
+        return specs
+
+
+def _deferred_plugin_func(filepath: str, tool_name: str) -> Callable[..., str]:
+    """Return a callable that imports the plugin on first use and runs tool_name."""
+    resolved: list[Callable[..., str]] = []
+
+    def call(**kwargs) -> str:
+        if not resolved:
+            scratch = ToolRegistry()
+            filename = os.path.basename(filepath)
+            if not ToolRegistry._exec_plugin(filename, filepath, scratch):
+                raise RuntimeError(f"plugin {filename} failed to load")
+            tool = scratch._tools.get(tool_name)
+            if tool is None:
+                raise RuntimeError(f"plugin {filename} no longer provides {tool_name}")
+            resolved.append(tool.func)
+        return resolved[0](**kwargs)
+
+    return call
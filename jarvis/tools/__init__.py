@@ -1,39 +1,70 @@
-from . import filesystem, gamedev, game_engine, planner_tools, shell, web
-from jarvis import tool_chain
+import importlib
 
 __all__ = ["register_all", "register_all_tools"]
 
+# Built-in tool modules and the categories their tools are registered under.
+# Used to defer importing a module until one of its categories is requested.
+_BUILTIN_MODULES: tuple[tuple[str, tuple[str, ...]], ...] = (
+    ("jarvis.tools.filesystem", ("general",)),
+    ("jarvis.tools.shell", ("general",)),
+    ("jarvis.tools.web", ("general", "web")),
+    ("jarvis.tools.gamedev", ("general",)),
+    ("jarvis.tools.game_engine", ("general",)),
+    ("jarvis.tools.planner_tools", ("planning",)),
+    ("jarvis.tool_chain", ("planning",)),
+)
 
-def register_all(registry, config=None):
+
+def _module_loader(module_name: str):
+    def load(registry):
+        importlib.import_module(module_name).register(registry)
+    return load
+
+
+def _computer_loader(config):
+    def load(registry):
+        # Computer control tools: always register (they work without API key).
+        # Only the AI vision tool (analyze_screen) needs an API key.
+        try:
+            from . import computer
+            computer.register(registry, config)
+        except ImportError:
+            pass  # pywinauto/pyautogui not installed
+    return load
+
+
+def _browser_loader(config):
+    def load(registry):
+        try:
+            from . import browser
+            browser.register(registry, config)
+        except ImportError:
+            pass
+    return load
+
+
+def register_all(registry, config=None, lazy: bool = False):
     """Register all built-in tools.
 
     All tools are always registered.  For local models (Ollama), the tool
     *router* in jarvis/tool_router.py selects the ~8 most relevant tools
     per request so the model context stays small.
-    """
-    filesystem.register(registry)
-    shell.register(registry)
-    web.register(registry)
-    gamedev.register(registry)
-    game_engine.register(registry)
-    planner_tools.register(registry)
-    tool_chain.register(registry)
-
-    # Computer control tools: always register (they work without API key).
-    # Only the AI vision tool (analyze_screen) needs an API key.
-    try:
-        from . import computer
-        computer.register(registry, config)
-    except ImportError:
-        pass  # pywinauto/pyautogui not installed
 
+    With ``lazy=True`` the tool modules are not imported here; each one is
+    queued on the registry and loaded the first time its category (or any
+    tool lookup) is needed.
+    """
+    loaders = [(cats, _module_loader(mod)) for mod, cats in _BUILTIN_MODULES]
+    loaders.append((("computer",), _computer_loader(config)))
     if config and config.api_key:
         # Browser automation requires API key for page analysis
-        try:
-            from . import browser
-            browser.register(registry, config)
-        except ImportError:
-            pass
+        loaders.append((("general",), _browser_loader(config)))
+
+    for cats, loader in loaders:
+        if lazy:
+            registry.register_lazy(cats, loader)
+        else:
+            loader(registry)
 
 
 # Alias so both names work across the codebase
@@ -1,5 +1,6 @@
 import datetime
 import glob as glob_module
+import operator
 import os
 import shutil
 import logging
@@ -36,14 +37,23 @@ def _validate_path(path: str, *, write: bool = False) -> str | None:
     return None
 
 
+_READ_MAX_CHARS = 50000
+
+
 def read_file(path: str) -> str:
     """Read and return the contents of a file."""
     try:
         path = os.path.expanduser(path)
         with open(path, "r", encoding="utf-8") as f:
-            content = f.read()
-        if len(content) > 50000:
-            content = content[:50000] + f"\n\n... (truncated, {len(content)} chars total)"
+            size = os.fstat(f.fileno()).st_size
+            # A UTF-8 char is at least one byte, so only files bigger than the
+            # limit in bytes can need truncating; never decode past the limit
+            if size <= _READ_MAX_CHARS:
+                content = f.read()
+            else:
+                content = f.read(_READ_MAX_CHARS + 1)
+                if len(content) > _READ_MAX_CHARS:
+                    content = content[:_READ_MAX_CHARS] + f"\n\n... (truncated, {size} bytes total)"
         return content if content else "(empty file)"
     except Exception as e:
         return f"Error: {e}"
@@ -68,6 +78,9 @@ def write_file(path: str, content: str) -> str:
         return f"Error: {e}"
 
 
+_entry_name = operator.attrgetter("name")
+
+
 def list_directory(path: str) -> str:
     """List directory contents or match a glob pattern."""
     try:
@@ -77,15 +90,15 @@ def list_directory(path: str) -> str:
             if not matches:
                 return "No matches found."
             return "\n".join(matches)
-        if os.path.isdir(path):
-            entries = sorted(os.listdir(path))
-            lines = []
-            for entry in entries:
-                full = os.path.join(path, entry)
-                prefix = "[DIR] " if os.path.isdir(full) else "      "
-                lines.append(f"{prefix}{entry}")
-            return "\n".join(lines) if lines else "(empty directory)"
-        return f"Error: {path} is not a directory."
+        try:
+            # DirEntry.is_dir() uses the type from the directory read itself,
+            # so listing costs one readdir pass instead of a stat per entry
+            with os.scandir(path) as it:
+                entries = sorted(it, key=_entry_name)
+        except (FileNotFoundError, NotADirectoryError):
+            return f"Error: {path} is not a directory."
+        lines = [f"{'[DIR] ' if e.is_dir() else '      '}{e.name}" for e in entries]
+        return "\n".join(lines) if lines else "(empty directory)"
     except Exception as e:
         return f"Error: {e}"
 
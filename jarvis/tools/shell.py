@@ -3,7 +3,6 @@ import os
 import re
 import subprocess
 import sys
-import tempfile
 
 from jarvis.tool_registry import ToolDef
 
@@ -31,27 +30,27 @@ def _check_dangerous(command: str) -> str | None:
     return None
 
 
+# Extra env for run_python's child interpreter: no .pyc litter, UTF-8 on the pipes
+_PYTHON_ENV = {"PYTHONDONTWRITEBYTECODE": "1", "PYTHONIOENCODING": "utf-8"}
+
+
 def run_python(code: str) -> str:
     """Execute Python code in a subprocess and return stdout/stderr."""
     try:
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".py", delete=False, encoding="utf-8"
-        ) as f:
-            f.write(code)
-            tmp_path = f.name
         result = subprocess.run(
-            [sys.executable, tmp_path],
+            [sys.executable, "-"],
+            input=code,
             capture_output=True,
-            text=True,
+            encoding="utf-8",
+            errors="replace",
+            env={**os.environ, **_PYTHON_ENV},
             timeout=30,
         )
-        os.unlink(tmp_path)
         output = result.stdout
         if result.stderr:
             output += f"\nSTDERR:\n{result.stderr}"
         return output.strip() if output.strip() else "(no output)"
     except subprocess.TimeoutExpired:
-        os.unlink(tmp_path)
         return "Error: Code execution timed out (30s limit)."
     except Exception as e:
         return f"Error: {e}"
@@ -1,11 +1,14 @@
 import ipaddress
 import re
+import threading
+from concurrent.futures import Future
 from urllib.parse import urlparse
 
 import httpx
 from bs4 import BeautifulSoup
 from ddgs import DDGS
 
+from jarvis.cache import ToolCache
 from jarvis.tool_registry import ToolDef
 
 
@@ -50,8 +53,49 @@ def _smart_truncate(text: str, max_length: int = MAX_CONTENT_LENGTH) -> str:
     return truncated + f"\n\n... (truncated, {len(text)} chars total)"
 
 
+# Successful searches keyed on the normalized query, so an agent re-asking the
+# same thing (modulo case/whitespace) doesn't re-scrape or trip DDG rate limits
+SEARCH_CACHE_TTL = 600
+_search_cache = ToolCache(default_ttl=SEARCH_CACHE_TTL, max_entries=512)
+
+
+def _normalize_query(query: str) -> str:
+    return " ".join(query.lower().split())
+
+
+# Searches currently running, so identical queries issued at the same time
+# (parallel tool calls, retries) share one DDG request instead of each scraping
+_inflight_searches: dict[str, Future] = {}
+_inflight_lock = threading.Lock()
+
+
 def search_web(query: str) -> str:
     """Search the web via DuckDuckGo and return formatted results."""
+    norm = _normalize_query(query)
+    key = {"q": norm}
+    cached = _search_cache.get("search_web", key)
+    if cached is not None:
+        return cached
+    with _inflight_lock:
+        pending = _inflight_searches.get(norm)
+        if pending is None:
+            _inflight_searches[norm] = future = Future()
+    if pending is not None:
+        return pending.result()
+    try:
+        text = _search(query, key)
+    except BaseException as e:
+        with _inflight_lock:
+            del _inflight_searches[norm]
+        future.set_exception(e)
+        raise
+    with _inflight_lock:
+        del _inflight_searches[norm]
+    future.set_result(text)
+    return text
+
+
+def _search(query: str, key: dict) -> str:
     try:
         with DDGS() as ddgs:
             results = list(ddgs.text(query, max_results=5))
@@ -60,9 +104,31 @@ def search_web(query: str) -> str:
         lines = []
         for r in results:
             lines.append(f"**{r['title']}**\n{r['href']}\n{r['body']}\n")
-        return "\n".join(lines)
+        text = "\n".join(lines)
     except Exception as e:
         return f"Search error: {e}"
+    _search_cache.set("search_web", key, text)
+    return text
+
+
+# Bodies are streamed and only this much is read: output is cut to
+# MAX_CONTENT_LENGTH chars anyway, so a huge page or file shouldn't be
+# buffered (and parsed) in full first.
+FETCH_MAX_BYTES = 2 * 1024 * 1024
+_FETCH_CHUNK = 64 * 1024
+
+
+def _read_capped(response: httpx.Response, limit: int = FETCH_MAX_BYTES) -> tuple[str, bool]:
+    """Decode at most *limit* bytes of a streamed body; return (text, clipped)."""
+    chunks = []
+    size = 0
+    for chunk in response.iter_bytes(_FETCH_CHUNK):
+        chunks.append(chunk)
+        size += len(chunk)
+        if size > limit:
+            break
+    body = b"".join(chunks)
+    return body[:limit].decode(response.encoding or "utf-8", errors="replace"), size > limit
 
 
 def fetch_url(url: str, selector: str = "") -> str:
@@ -71,15 +137,17 @@ def fetch_url(url: str, selector: str = "") -> str:
         return "Error: cannot fetch internal/private URLs (SSRF protection)."
     try:
         headers = {"User-Agent": "Mozilla/5.0 (compatible; Jarvis/1.0)"}
-        response = httpx.get(url, headers=headers, follow_redirects=True, timeout=15)
-        response.raise_for_status()
+        with httpx.stream("GET", url, headers=headers, follow_redirects=True, timeout=15) as response:
+            response.raise_for_status()
+            content_type = response.headers.get("content-type", "")
+            body, clipped = _read_capped(response)
+        note = f"\n\n(response exceeded {FETCH_MAX_BYTES} bytes; only the start was read)" if clipped else ""
 
-        content_type = response.headers.get("content-type", "")
         if "text/html" not in content_type and "application/xhtml" not in content_type:
-            text = _smart_truncate(response.text)
-            return text if text else "(empty response)"
+            text = _smart_truncate(body)
+            return text + note if text else "(empty response)"
 
-        soup = BeautifulSoup(response.text, "lxml")
+        soup = BeautifulSoup(body, "lxml")
 
         # Remove non-content elements
         for tag in soup(["script", "style", "nav", "header", "footer", "aside"]):
@@ -96,7 +164,7 @@ def fetch_url(url: str, selector: str = "") -> str:
         text = re.sub(r"\n{3,}", "\n\n", text)
 
         text = _smart_truncate(text)
-        return text if text else "(no readable content)"
+        return text + note if text else "(no readable content)"
     except Exception as e:
         return f"Error fetching URL: {e}"
 
@@ -6,6 +6,7 @@ pull requests, and create issues/PRs.
 Requires: GITHUB_TOKEN env var with appropriate scopes.
 """
 
+import functools
 import json
 import os
 
@@ -18,7 +19,12 @@ TIMEOUT = 15
 
 
 def _headers() -> dict:
-    token = os.getenv("GITHUB_TOKEN", "")
+    return _headers_for(os.getenv("GITHUB_TOKEN", ""))
+
+
+@functools.lru_cache(maxsize=4)
+def _headers_for(token: str) -> dict:
+    """Build (once per token) the read-only header dict shared by every request."""
     if not token:
         return {}
     return {
@@ -28,12 +34,12 @@ def _headers() -> dict:
     }
 
 
-def _get(endpoint: str) -> dict | list | str:
+def _get(endpoint: str, params: dict | None = None) -> dict | list | str:
     headers = _headers()
     if not headers:
         return "Error: GITHUB_TOKEN not set in environment."
     try:
-        resp = httpx.get(f"{GITHUB_API}{endpoint}", headers=headers, timeout=TIMEOUT)
+        resp = httpx.get(f"{GITHUB_API}{endpoint}", params=params, headers=headers, timeout=TIMEOUT)
         resp.raise_for_status()
         return resp.json()
     except Exception as e:
@@ -54,8 +60,8 @@ def _post(endpoint: str, data: dict) -> dict | str:
 
 def github_list_repos(owner: str = "", per_page: int = 10) -> str:
     """List repositories for a user/org or the authenticated user."""
-    endpoint = f"/users/{owner}/repos?per_page={per_page}&sort=updated" if owner else f"/user/repos?per_page={per_page}&sort=updated"
-    result = _get(endpoint)
+    endpoint = f"/users/{owner}/repos" if owner else "/user/repos"
+    result = _get(endpoint, {"per_page": per_page, "sort": "updated"})
     if isinstance(result, str):
         return result
     lines = []
@@ -68,7 +74,7 @@ def github_list_repos(owner: str = "", per_page: int = 10) -> str:
 
 def github_list_issues(repo: str, state: str = "open", per_page: int = 10) -> str:
     """List issues for a repository."""
-    result = _get(f"/repos/{repo}/issues?state={state}&per_page={per_page}")
+    result = _get(f"/repos/{repo}/issues", {"state": state, "per_page": per_page})
     if isinstance(result, str):
         return result
     lines = []
@@ -93,7 +99,7 @@ def github_create_issue(repo: str, title: str, body: str = "", labels: str = "")
 
 def github_list_prs(repo: str, state: str = "open", per_page: int = 10) -> str:
     """List pull requests for a repository."""
-    result = _get(f"/repos/{repo}/pulls?state={state}&per_page={per_page}")
+    result = _get(f"/repos/{repo}/pulls", {"state": state, "per_page": per_page})
     if isinstance(result, str):
         return result
     lines = []
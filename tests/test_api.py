@@ -1,9 +1,12 @@
 """Tests for the Jarvis API endpoints (auth, health, stats, learnings, session management)."""
 
+import base64
+import io
 import json
 import os
 import sys
 import tempfile
+import zipfile
 
 import pytest
 
@@ -17,6 +20,12 @@ def clean_users(tmp_path, monkeypatch):
     os.makedirs(data_dir, exist_ok=True)
     monkeypatch.setattr("api.auth.DATA_DIR", data_dir)
     monkeypatch.setattr("api.auth.USERS_FILE", os.path.join(data_dir, "users.json"))
+    monkeypatch.setattr("api.auth.API_KEYS_FILE", os.path.join(data_dir, "api_keys.json"))
+    monkeypatch.setattr("api.auth.BCRYPT_COST", 4)
+    yield
+    # Write coalesced last_used touches while the temp store is still patched in
+    from api.auth import flush_api_key_touches
+    flush_api_key_touches()
 
 
 @pytest.fixture
@@ -135,6 +144,91 @@ class TestAuth:
         resp = client.get("/api/auth/me", headers={"Authorization": "Bearer invalid-token"})
         assert resp.status_code == 401
 
+    def test_revoked_api_key_not_served_from_cache(self, client, auth_headers):
+        api_key = client.post("/api/auth/api-keys", json={"label": "ci"}, headers=auth_headers).json()["api_key"]
+        key_headers = {"Authorization": f"Bearer {api_key['key']}"}
+        assert client.get("/api/auth/me", headers=key_headers).status_code == 200
+
+        assert client.delete(f"/api/auth/api-keys/{api_key['id']}", headers=auth_headers).status_code == 200
+        assert client.get("/api/auth/me", headers=key_headers).status_code == 401
+
+    def test_api_key_rejected_after_account_deletion(self, client, auth_headers):
+        key = client.post("/api/auth/api-keys", json={"label": "ci"}, headers=auth_headers).json()["api_key"]["key"]
+        key_headers = {"Authorization": f"Bearer {key}"}
+        assert client.get("/api/auth/me", headers=key_headers).status_code == 200
+
+        resp = client.delete("/api/compliance/delete-account", headers=auth_headers)
+        assert resp.status_code == 200
+        assert resp.json()["summary"]["api_keys"] == 1
+        assert client.get("/api/auth/me", headers=key_headers).status_code == 401
+
+    def test_export_includes_latest_audit_entries(self, client, auth_headers):
+        resp = client.get("/api/compliance/export", headers=auth_headers)
+        assert resp.status_code == 200
+        with zipfile.ZipFile(io.BytesIO(resp.content)) as zf:
+            actions = [entry["action"] for entry in json.loads(zf.read("audit_log.json"))]
+        assert "register" in actions
+
+
+class TestDecodeToken:
+    def test_round_trip(self):
+        from api.auth import create_token, decode_token
+        payload = decode_token(create_token({"id": "u1", "username": "alice"}))
+        assert payload["sub"] == "u1"
+        assert payload["username"] == "alice"
+
+    def test_rejects_tampered_payload(self):
+        from api.auth import create_token, decode_token
+        header, _, signature = create_token({"id": "u1", "username": "alice"}).split(".")
+        forged = base64.urlsafe_b64encode(b'{"sub":"admin","exp":9999999999}').rstrip(b"=").decode()
+        assert decode_token(f"{header}.{forged}.{signature}") is None
+
+    def test_rejects_expired(self, monkeypatch):
+        from api.auth import create_token, decode_token
+        monkeypatch.setattr("api.auth.JWT_EXPIRY_HOURS", -1)
+        assert decode_token(create_token({"id": "u1", "username": "alice"})) is None
+
+
+class TestApiKeyStore:
+    def test_append_after_another_worker_compacted(self):
+        from api import auth
+        first = auth.create_api_key("u1")
+        # Another worker compacts: the snapshot is rewritten and the WAL we
+        # hold open is unlinked
+        auth._save_api_keys(auth._load_api_keys())
+        os.remove(auth._api_keys_wal_path())
+        second = auth.create_api_key("u1")
+        assert {k["id"] for k in auth.list_user_api_keys("u1")} == {first["id"], second["id"]}
+
+    def test_index_survives_compaction_between_stat_and_read(self, monkeypatch):
+        from api import auth
+        created = auth.create_api_key("u1")
+        real_stamp = auth._file_stamp
+
+        def stamp_then_compact(path):
+            stamp = real_stamp(path)
+            if path == auth._api_keys_wal_path():
+                # Another worker compacts (and deletes the WAL) right after our stat
+                monkeypatch.setattr(auth, "_file_stamp", real_stamp)
+                auth.compact_api_keys()
+                auth._api_keys_index = None  # That worker's index isn't ours
+            return stamp
+
+        monkeypatch.setattr(auth, "_file_stamp", stamp_then_compact)
+        assert [k["id"] for k in auth.list_user_api_keys("u1")] == [created["id"]]
+
+    def test_revoke_user_api_keys_erases_snapshot_and_wal_keys(self):
+        from api import auth
+        auth.create_api_key("u1")
+        auth.compact_api_keys()  # One key in the snapshot...
+        auth.create_api_key("u1")  # ...and one only in the WAL
+        kept = auth.create_api_key("u2")
+        assert auth.revoke_user_api_keys("u1") == 2
+        assert auth.list_user_api_keys("u1") == []
+        assert [k["id"] for k in auth.list_user_api_keys("u2")] == [kept["id"]]
+        with open(auth.API_KEYS_FILE, "rb") as f:
+            assert b'"u1"' not in f.read()
+
 
 # --- Stats Endpoint ---
 
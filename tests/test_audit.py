@@ -0,0 +1,14 @@
+"""Tests for the audit log reader (api/audit.py)."""
+
+import io
+
+from api import audit
+
+
+def test_tail_lines_keeps_complete_line_at_block_boundary(monkeypatch):
+    data = b"".join(b"line%d\n" % i for i in range(50))
+    for chunk in range(1, 40):
+        monkeypatch.setattr(audit, "_TAIL_CHUNK", chunk)
+        for limit in range(1, 20):
+            expected = [b"line%d" % i for i in range(50 - limit, 50)]
+            assert audit._tail_lines(io.BytesIO(data), limit) == expected
@@ -69,6 +69,27 @@ class TestClaudeBackend:
         assert result.tool_calls[0].name == "echo"
         assert result.tool_calls[0].args == {"text": "hi"}
 
+    def test_send_streams_text_to_callback(self):
+        backend, _ = self._make_backend()
+        mock_block = MagicMock()
+        mock_block.type = "text"
+        mock_block.text = "Hello!"
+        final = MagicMock()
+        final.content = [mock_block]
+        stream = MagicMock()
+        stream.text_stream = iter(["Hel", "lo!"])
+        stream.get_final_message.return_value = final
+        backend.client.messages.stream = MagicMock()
+        backend.client.messages.stream.return_value.__enter__.return_value = stream
+
+        chunks = []
+        with patch("jarvis.backends.claude.retry_api_call", side_effect=lambda fn, **kw: fn(**kw)):
+            result = backend.send([], "system", [], on_text=chunks.append)
+
+        assert chunks == ["Hel", "lo!"]
+        assert result.text == "Hello!"
+        backend.client.messages.create.assert_not_called()
+
     def test_format_user_message(self):
         backend, _ = self._make_backend()
         msg = backend.format_user_message("hello")
@@ -5,7 +5,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from jarvis.backends.base import Backend, BackendResponse, ToolCall
-from jarvis.conversation import Conversation
+from jarvis.conversation import Conversation, StreamEvent
 from jarvis.tool_registry import ToolDef, ToolRegistry
 
 
@@ -85,6 +85,31 @@ def test_max_tool_turns_limit():
     assert "Stopped after" in result
 
 
+def test_resolve_tools_reuses_list_until_registry_changes():
+    registry = ToolRegistry()
+    registry.register(ToolDef(name="a", description="A", parameters={"properties": {}}, func=lambda: "a"))
+    convo = Conversation(FakeBackend([]), registry, "system", 1000)
+    first = convo._resolve_tools("hi")
+    assert convo._resolve_tools("again") is first
+    registry.register(ToolDef(name="b", description="B", parameters={"properties": {}}, func=lambda: "b"))
+    assert [t.name for t in convo._resolve_tools("hi")] == ["a", "b"]
+
+
+def test_backend_tool_schemas_rebuilt_only_for_a_new_tools_list():
+    backend = FakeBackend([])
+    tools = [ToolDef(name="a", description="A", parameters={"properties": {}}, func=lambda: "")]
+    builds = []
+
+    def build(ts):
+        builds.append(ts)
+        return [t.schema_anthropic() for t in ts]
+
+    first = backend._tool_schemas(tools, build)
+    assert backend._tool_schemas(tools, build) is first
+    assert backend._tool_schemas(list(tools), build) == first
+    assert len(builds) == 2
+
+
 def test_clear():
     backend = FakeBackend([BackendResponse(text="Hi", tool_calls=[])])
     registry = ToolRegistry()
@@ -100,10 +125,32 @@ def test_trim_history():
     backend = FakeBackend(backend_responses)
     registry = ToolRegistry()
     convo = Conversation(backend, registry, "system", 1000)
+    messages = convo.messages
     for i in range(110):
         convo.send(f"msg{i}")
     # After many sends, messages should be trimmed to MAX_MESSAGES
     assert len(convo.messages) <= convo.MAX_MESSAGES
+    # Truncation happens in place and keeps the newest messages
+    assert convo.messages is messages
+    assert convo.messages[-1]["content"] == "resp109"
+
+
+def test_history_chars_tracks_appends_trims_and_rewrites():
+    from jarvis.context_manager import message_chars
+
+    backend = FakeBackend([BackendResponse(text="r" * i, tool_calls=[]) for i in range(120)])
+    convo = Conversation(backend, ToolRegistry(), "system", 1000)
+
+    def full_count():
+        return sum(message_chars(m) for m in convo.messages)
+
+    for i in range(110):
+        convo.send(f"msg{i}")
+        assert convo._history_chars() == full_count()
+    convo.messages = convo.messages[-10:]
+    assert convo._history_chars() == full_count()
+    convo.messages.append({"role": "user", "content": [{"type": "text", "text": "hello"}]})
+    assert convo._history_chars() == full_count()
 
 
 def test_call_backend_delegates_to_backend():
@@ -127,3 +174,35 @@ def test_call_backend_propagates_errors():
     convo = Conversation(backend, registry, "system", 1000)
     with pytest.raises(ValueError, match="Invalid model name"):
         convo._call_backend(registry.all_tools())
+
+
+def test_send_stream_runs_tool_calls_in_order():
+    import queue
+
+    backend = FakeBackend([
+        BackendResponse(text=None, tool_calls=[
+            ToolCall(id="tc1", name="echo", args={"text": "a"}),
+            ToolCall(id="tc2", name="echo", args={"text": "b"}),
+        ]),
+        BackendResponse(text="Done!", tool_calls=[]),
+    ])
+    registry = ToolRegistry()
+    registry.register(ToolDef(
+        name="echo",
+        description="Echo",
+        parameters={"properties": {"text": {"type": "string"}}, "required": ["text"]},
+        func=lambda text: f"echo: {text}",
+    ))
+    convo = Conversation(backend, registry, "system", 1000)
+    events = queue.Queue()
+    convo.send_stream("Run echo twice", events)
+
+    seen = []
+    while not events.empty():
+        seen.append(events.get())
+    assert all(isinstance(e, StreamEvent) for e in seen)
+    names = [e.name for e in seen]
+    assert names == ["thinking", "tool_call", "tool_call", "tool_result", "tool_result",
+                     "thinking", "text", "done"]
+    results = [e.data for e in seen if e.name == "tool_result"]
+    assert results == [{"id": "tc1", "result": "echo: a"}, {"id": "tc2", "result": "echo: b"}]
@@ -70,3 +70,19 @@ def test_persistence(tmp_path):
     m2 = Memory(path=path)
     assert m2.count == 1
     assert m2.all_learnings[0]["insight"] == "data"
+
+
+def test_load_dict_format(tmp_path):
+    path = tmp_path / "learnings.json"
+    path.write_text('{"learnings": [{"category": "x", "insight": "é"}]}', encoding="utf-8")
+    mem = Memory(path=str(path))
+    assert mem.count == 1
+    assert mem.all_learnings[0]["insight"] == "é"
+
+
+def test_get_relevant_sees_learnings_saved_after_first_search(memory):
+    memory.save_learning("python", "Use generators")
+    assert len(memory.get_relevant("PYTHON")) == 1
+    memory.save_learning("rust", "Python bindings via PyO3")
+    assert [e["category"] for e in memory.get_relevant("python")] == ["python", "rust"]
+    assert memory.get_relevant("generators\0rust") == []
@@ -20,6 +20,12 @@ def test_all_tools(registry, sample_tool):
     assert tools[0].name == "echo"
 
 
+def test_tool_count(registry, sample_tool):
+    assert registry.tool_count == 0
+    registry.register(sample_tool)
+    assert registry.tool_count == 1
+
+
 def test_handle_call_success(registry, sample_tool):
     registry.register(sample_tool)
     result = registry.handle_call("echo", {"text": "hello"})
@@ -83,3 +89,78 @@ def test_register_overwrites(registry):
     registry.register(tool2)
     assert registry.get("t").description == "v2"
     assert registry.handle_call("t", {}) == "v2"
+
+
+def test_lazy_loader_runs_on_category(registry):
+    calls = []
+
+    def load_web(reg):
+        calls.append("web")
+        reg.register(ToolDef("w", "web", {"properties": {}, "required": []}, func=lambda: "w", category="web"))
+
+    def load_general(reg):
+        calls.append("general")
+        reg.register(ToolDef("g", "general", {"properties": {}, "required": []}, func=lambda: "g"))
+
+    registry.register_lazy(("web",), load_web)
+    registry.register_lazy(("general",), load_general)
+    assert calls == []
+    assert [t.name for t in registry.tools_by_category("web")] == ["w"]
+    assert calls == ["web"]
+    assert registry.get("g") is not None
+    assert calls == ["web", "general"]
+
+
+def test_lazy_loader_without_categories_always_runs(registry):
+    registry.register_lazy((), lambda reg: reg.register(
+        ToolDef("p", "plugin", {"properties": {}, "required": []}, func=lambda: "p", category="custom")))
+    assert [t.name for t in registry.tools_by_category("custom")] == ["p"]
+
+
+def test_category_index_sorted_and_updated_on_overwrite(registry):
+    for name, cat in [("b", "web"), ("a", "web"), ("c", "general")]:
+        registry.register(ToolDef(name, name, {"properties": {}, "required": []}, func=lambda: "", category=cat))
+    assert [t.name for t in registry.tools_by_category("web")] == ["a", "b"]
+    assert [t.name for t in registry.sorted_tools()] == ["c", "a", "b"]
+    registry.register(ToolDef("a", "moved", {"properties": {}, "required": []}, func=lambda: "", category="general"))
+    assert [t.name for t in registry.tools_by_category("web")] == ["b"]
+    assert registry.categories() == ["general", "web"]
+
+
+_PLUGIN_SOURCE = '''
+import builtins
+from jarvis.tool_registry import ToolDef
+
+builtins._jarvis_plugin_execs = getattr(builtins, "_jarvis_plugin_execs", 0) + 1
+
+
+def register(registry):
+    registry.register(ToolDef(
+        name="shout",
+        description="Upper-cases text.",
+        parameters={"properties": {"text": {"type": "string"}}, "required": ["text"]},
+        func=lambda text: text.upper(),
+        category="custom",
+    ))
+'''
+
+
+def test_load_plugins_schema_cache(tmp_path):
+    import builtins
+
+    (tmp_path / "shout.py").write_text(_PLUGIN_SOURCE, encoding="utf-8")
+    builtins._jarvis_plugin_execs = 0
+
+    first = ToolRegistry()
+    first.load_plugins(str(tmp_path), use_cache=True)
+    assert builtins._jarvis_plugin_execs == 1
+    assert (tmp_path / ".cache.json").exists()
+
+    second = ToolRegistry()
+    second.load_plugins(str(tmp_path), use_cache=True)
+    # Registered from the cache without executing the plugin module
+    assert builtins._jarvis_plugin_execs == 1
+    assert second.get("shout").category == "custom"
+    assert second.handle_call("shout", {"text": "hi"}) == "HI"
+    assert builtins._jarvis_plugin_execs == 2
+    del builtins._jarvis_plugin_execs
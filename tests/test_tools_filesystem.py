@@ -25,6 +25,15 @@ def test_read_file(tmp_dir):
     assert "hello world" in result
 
 
+def test_read_file_truncates_large_file(tmp_dir):
+    path = os.path.join(tmp_dir, "big.txt")
+    with open(path, "w") as f:
+        f.write("x" * 60000)
+    result = read_file(path)
+    assert result.startswith("x" * 50000)
+    assert "truncated, 60000 bytes total" in result
+
+
 def test_read_file_missing():
     result = read_file("/nonexistent/path/file.txt")
     assert "Error" in result
@@ -1,5 +1,7 @@
 """Tests for web tools: search, fetch, SSRF protection."""
 
+import threading
+
 import pytest
 
 from jarvis.tools.web import _is_internal_url, fetch_url
@@ -45,3 +47,86 @@ class TestFetchUrl:
     def test_fetch_private_ip_blocked(self):
         result = fetch_url("http://10.0.0.1/admin")
         assert "SSRF" in result or "internal" in result.lower()
+
+
+class TestSearchWebCache:
+    def test_repeat_query_served_from_cache(self, monkeypatch):
+        from jarvis.tools import web
+
+        calls = []
+
+        class FakeDDGS:
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                return False
+
+            def text(self, query, max_results=5):
+                calls.append(query)
+                return [{"title": "T", "href": "https://example.com", "body": "B"}]
+
+        monkeypatch.setattr(web, "DDGS", FakeDDGS)
+        web._search_cache.clear()
+        first = web.search_web("Python  GIL")
+        second = web.search_web("python gil")
+        assert first == second
+        assert calls == ["Python  GIL"]
+
+    def test_concurrent_identical_queries_share_one_request(self, monkeypatch):
+        from jarvis.tools import web
+
+        calls = []
+        release = threading.Event()
+
+        class SlowDDGS:
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                return False
+
+            def text(self, query, max_results=5):
+                calls.append(query)
+                release.wait(5)
+                return [{"title": "T", "href": "https://example.com", "body": "B"}]
+
+        monkeypatch.setattr(web, "DDGS", SlowDDGS)
+        web._search_cache.clear()
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(web.search_web("rust async"))) for _ in range(4)]
+        for t in threads:
+            t.start()
+        while not calls:
+            threading.Event().wait(0.01)
+        release.set()
+        for t in threads:
+            t.join(5)
+        assert len(calls) == 1
+        assert len(results) == 4 and len(set(results)) == 1
+
+
+class TestReadCapped:
+    class FakeResponse:
+        encoding = "utf-8"
+
+        def __init__(self, chunks):
+            self._chunks = chunks
+
+        def iter_bytes(self, chunk_size=None):
+            yield from self._chunks
+
+    def test_small_body_read_in_full(self):
+        from jarvis.tools.web import _read_capped
+        assert _read_capped(self.FakeResponse([b"hello ", b"world"]), limit=100) == ("hello world", False)
+
+    def test_stops_reading_past_limit(self):
+        from jarvis.tools.web import _read_capped
+
+        def endless():
+            while True:
+                yield b"x" * 4
+
+        text, clipped = _read_capped(self.FakeResponse(endless()), limit=10)
+        assert text == "x" * 10
+        assert clipped is True
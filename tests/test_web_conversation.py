@@ -79,3 +79,138 @@ def test_web_conversation_tracks_stats():
     convo.send("test")
     assert convo.total_tool_calls == 1
     assert convo.total_turns == 1
+
+
+def test_web_conversation_stream_runs_tool_calls_concurrently():
+    import queue
+    import threading
+
+    backend = FakeBackend([
+        BackendResponse(text=None, tool_calls=[
+            ToolCall(id="tc1", name="wait", args={"tag": "a"}),
+            ToolCall(id="tc2", name="wait", args={"tag": "b"}),
+        ]),
+        BackendResponse(text="ok", tool_calls=[]),
+    ])
+    # Each call blocks until both are running, so a sequential loop would time out
+    barrier = threading.Barrier(2, timeout=5)
+
+    def wait(tag):
+        barrier.wait()
+        return f"done {tag}"
+
+    registry = ToolRegistry()
+    registry.register(ToolDef(
+        name="wait", description="w",
+        parameters={"properties": {"tag": {"type": "string"}}, "required": ["tag"]},
+        func=wait,
+    ))
+    convo = WebConversation(backend=backend, registry=registry, system="test", max_tokens=100)
+    events = queue.Queue()
+    assert convo.send_stream("test", events) == "ok"
+
+    emitted = [events.get_nowait() for _ in range(events.qsize())]
+    results = {e.data["id"]: e.data["result"] for e in emitted if e.name == "tool_result"}
+    assert results == {"tc1": "done a", "tc2": "done b"}
+    calls = convo.get_and_clear_tool_calls()
+    assert [c["id"] for c in calls] == ["tc1", "tc2"]
+    assert convo.total_tool_calls == 2
+
+
+def test_web_conversation_reuses_tool_pool_across_turns():
+    import threading
+
+    calls = [ToolCall(id=f"tc{i}", name="who", args={}) for i in range(2)]
+    backend = FakeBackend([
+        BackendResponse(text=None, tool_calls=calls),
+        BackendResponse(text=None, tool_calls=calls),
+        BackendResponse(text="ok", tool_calls=[]),
+    ])
+    registry = ToolRegistry()
+    registry.register(ToolDef(
+        name="who", description="w", parameters={"properties": {}},
+        func=lambda: threading.current_thread().name,
+    ))
+    convo = WebConversation(backend=backend, registry=registry, system="test", max_tokens=100)
+    assert convo.send("test") == "ok"
+    workers = {c["result"] for c in convo.get_and_clear_tool_calls()}
+    assert all(name.startswith("jarvis-tool") for name in workers)
+    assert len(workers) <= convo.TOOL_WORKERS
+
+
+def test_truncate_result_only_copies_oversized_results():
+    convo = WebConversation(backend=FakeBackend([]), registry=ToolRegistry(), system="test", max_tokens=100)
+    small = "x" * convo.DISPLAY_RESULT_CHARS
+    assert convo._truncate_result(small) is small
+    big = "y" * (convo.DISPLAY_RESULT_CHARS + 1)
+    display = convo._truncate_result(big)
+    assert display.startswith("y" * convo.DISPLAY_RESULT_CHARS + "\n")
+    assert display.endswith(f"(truncated, {len(big)} chars total)")
+
+
+def test_async_event_queue_delivers_events_from_worker_thread():
+    import asyncio
+    import threading
+
+    from api.enhanced_conversation import AsyncEventQueue, StreamEvent
+
+    async def consume():
+        events = AsyncEventQueue()
+        worker = threading.Thread(target=lambda: [events.put(StreamEvent(str(i), {})) for i in range(3)])
+        worker.start()
+        received = [(await events.get(timeout=5)).name for _ in range(3)]
+        worker.join()
+        try:
+            await events.get(timeout=0.01)
+        except asyncio.TimeoutError:
+            return received
+        raise AssertionError("expected an empty queue to time out")
+
+    assert asyncio.run(consume()) == ["0", "1", "2"]
+
+
+def test_get_display_messages_keeps_only_conversation_text():
+    convo = WebConversation(backend=FakeBackend([]), registry=ToolRegistry(), system="test", max_tokens=100)
+    convo.messages = [
+        {"role": "user", "content": "hi"},
+        {"role": "assistant", "content": [
+            {"type": "text", "text": "let me check"},
+            {"type": "tool_use", "id": "tc1", "name": "echo", "input": {}},
+        ]},
+        {"role": "user", "content": [{"type": "tool_result", "tool_use_id": "tc1", "content": "x"}]},
+        {"role": "tool", "content": "raw tool output"},
+        {"role": "assistant", "content": ""},
+        {"role": "assistant", "content": "done"},
+    ]
+    assert convo.get_display_messages() == [
+        {"role": "user", "content": "hi"},
+        {"role": "assistant", "content": "let me check"},
+        {"role": "assistant", "content": "done"},
+    ]
+
+
+def test_get_display_messages_converts_only_new_history():
+    convo = WebConversation(backend=FakeBackend([]), registry=ToolRegistry(), system="test", max_tokens=100)
+    convo.messages.append({"role": "user", "content": "one"})
+    first = convo.get_display_messages()
+    first.append({"role": "user", "content": "caller's own list"})
+    convo.messages.append({"role": "assistant", "content": "two"})
+    assert [m["content"] for m in convo.get_display_messages()] == ["one", "two"]
+    del convo.messages[:1]
+    assert [m["content"] for m in convo.get_display_messages()] == ["two"]
+    convo.messages = [{"role": "user", "content": "restored"}]
+    assert [m["content"] for m in convo.get_display_messages()] == ["restored"]
+
+
+def test_first_user_message_follows_history_changes():
+    convo = WebConversation(backend=FakeBackend([]), registry=ToolRegistry(), system="test", max_tokens=100)
+    assert convo.get_first_user_message() == ""
+    convo.messages.append({"role": "user", "content": "first question"})
+    convo.messages.append({"role": "assistant", "content": "answer"})
+    assert convo.get_first_user_message() == "first question"
+    convo.messages.append({"role": "user", "content": "second question"})
+    assert convo.get_first_user_message() == "first question"
+    del convo.messages[:2]
+    assert convo.get_first_user_message() == "second question"
+    convo.clear()
+    assert convo.get_first_user_message() == ""